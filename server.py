@@ -1,17 +1,35 @@
 import os
-import pyodbc
-from fastmcp import FastMCP
-from win32com.client import Dispatch
-import win32com.client
+import sys
+import time
+import json
+import base64
+import datetime
+import decimal
+
+# Captured before anything heavy is imported so the startup report can show
+# how long module import took end to end.
+_SERVER_START = time.perf_counter()
+
+import importlib
+import threading
+import queue
 import uuid
 import random
 import tempfile
 import re
 import gc
-import pythoncom
-import time
+import signal
+import hashlib
+import atexit
+import itertools
+import shutil
+import fnmatch
+import difflib
+from concurrent.futures import ThreadPoolExecutor
 import logging
+from collections import OrderedDict, deque
 from typing import Callable, Tuple, Optional, List, Dict, Any
+from fastmcp import FastMCP
 
 # Configure logging
 logging.basicConfig(
@@ -28,8 +46,93 @@ class Config:
     LOCK_TIMEOUT = 10  # seconds to wait for lock release
     CLEANUP_DELAY = 0.5  # seconds to wait after cleanup
     MAX_RETRIES = 3  # maximum retry attempts for transient errors
-    RETRY_DELAY = 1.0  # seconds between retries
+    RETRY_DELAY = 1.0  # base delay before the first retry; doubled (with jitter) for each further retry
+    RETRY_MAX_DELAY = 8.0  # cap on a single backoff delay
+    RETRY_DEADLINE = 30.0  # seconds after which a failing call is no longer retried
+    # Default deadline (seconds) per tool when the call does not pass timeout_seconds; 0 disables.
+    # An overrunning ODBC statement is cancelled by the driver's query timeout; an overrunning
+    # COM call has its Access process terminated.
+    TOOL_DEADLINES = {"run_query": 120, "execute_many": 300, "run_vba_function": 120, "run_vba_functions": 600}
+    WATCHDOG_INTERVAL = 30  # seconds between background sweeps of launched Access processes; 0 disables
+    WATCHDOG_ORPHAN_GRACE = 15  # seconds a released Access instance may take to exit before it is terminated
+    # Seconds an in-use instance may stay unresponsive before it is terminated. Instances running
+    # a call with a deadline (TOOL_DEADLINES / timeout_seconds) are left alone until it passes.
+    WATCHDOG_HUNG_SECONDS = 300
+    WATCHDOG_RESPONSE_TIMEOUT = 5  # seconds an Access window has to answer a ping
     POLL_INTERVAL = 0.5  # seconds between lock file checks
+    # What to do when another holder has the database open: "wait" (poll up to
+    # LOCK_TIMEOUT), "fail" (return immediately) or "shared" (tools that only read
+    # open the database shared alongside the holder, write tools still wait).
+    # Access itself is not opened in a read-only mode; the tool simply writes nothing.
+    LOCK_POLICY = os.environ.get("MSACCESS_MCP_LOCK_POLICY", "wait").strip().lower()
+    CLEAR_STALE_LOCKS = True  # delete lock files that no process holds open
+    STARTUP_BUDGET = 1.0  # seconds allowed for module import before a warning is logged
+    # Background warm-up after start: "" (off), "drivers" (pyodbc + ODBC driver lookup)
+    # or "access" (drivers plus one Access launch to prime the COM server)
+    WARMUP = os.environ.get("MSACCESS_MCP_WARMUP", "").strip().lower()
+    WARMUP_DELAY = 1.0  # seconds to wait so warm-up runs after the MCP handshake
+    STATEMENT_CACHE_SIZE = 32  # prepared statements kept per pooled ODBC connection
+    CONNECTION_IDLE_TIMEOUT = 60  # seconds before an unused pooled ODBC connection is closed
+    VBA_INDEX_CACHE_SIZE = 512  # parsed VBA modules kept for search_vba_code (least recently used evicted)
+    # Directory for LoadFromText scratch files. Windows has no built-in RAM-backed
+    # temp dir, so the speedup needs this to point at a RAM disk (e.g. an ImDisk
+    # volume such as R:\); empty or missing falls back to the system temp dir.
+    SCRATCH_DIR = os.environ.get("MSACCESS_MCP_SCRATCH_DIR", "")
+    # Write scratch files as UTF-16 (the encoding SaveAsText produces) instead of UTF-8
+    SCRATCH_UTF16 = os.environ.get("MSACCESS_MCP_SCRATCH_UTF16", "").strip().lower() in ("1", "true", "yes")
+    EXPORT_CHUNK_SIZE = 25  # objects exported before their files are handed off for hashing
+    STATS_SAMPLE_ROWS = 1000  # rows sampled to estimate row size and column cardinality
+    MAX_RESULT_ROWS = 1000  # hard cap on rows returned by one query response
+    MAX_RESULT_BYTES = 1_000_000  # hard cap on formatted size of one query response
+    MAX_FETCH_SECONDS = 30.0  # hard cap on time spent fetching rows for one response
+    FETCH_BATCH_SIZE = 200  # rows pulled from the driver per fetchmany() call
+    RESULT_HANDLE_TTL = 300  # seconds a truncated result stays available for fetch_more_results
+    MAX_OPEN_RESULTS = 8  # truncated results kept open at once (oldest are cancelled)
+    # Directory for read-replica copies used by analytic queries. Empty uses the system temp dir.
+    SNAPSHOT_DIR = os.environ.get("MSACCESS_MCP_SNAPSHOT_DIR", "")
+    SNAPSHOT_MAX_STALENESS = 300  # seconds a snapshot may lag behind a changed database
+    SNAPSHOT_GENERATIONS = 2  # snapshots kept per database (older ones may still back open results)
+
+# --- Lazy Backends ---
+# pyodbc and pywin32 are only needed once a tool touches a database, so they are
+# imported on first use instead of at startup. This keeps the MCP handshake and
+# tool listing fast when a client spawns the server per session.
+_import_lock = threading.Lock()
+_import_timings: Dict[str, float] = {}
+
+class _LazyModule:
+    """Module proxy that performs the real import on first attribute access.
+
+    For dotted names (e.g. 'win32com.client') the submodule is imported and the
+    top-level package is exposed, so 'win32com.client.Dispatch' keeps working.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            with _import_lock:
+                if self._module is None:
+                    start = time.perf_counter()
+                    importlib.import_module(self._name)
+                    _import_timings[self._name] = time.perf_counter() - start
+                    self._module = sys.modules[self._name.split('.')[0]]
+                    logger.debug(f"Lazily imported {self._name} in {_import_timings[self._name]:.3f}s")
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+pyodbc = _LazyModule("pyodbc")
+win32com = _LazyModule("win32com.client")
+pythoncom = _LazyModule("pythoncom")
+win32process = _LazyModule("win32process")
+win32api = _LazyModule("win32api")
+win32gui = _LazyModule("win32gui")
+win32event = _LazyModule("win32event")
+win32file = _LazyModule("win32file")
 
 # --- State Tracking ---
 _template_generated = False
@@ -41,6 +144,10 @@ _batch_mode_access = None
 
 def _ensure_access_closed():
     """Force close all Access instances and clean up COM objects"""
+    # Drop cached VBComponent references before COM is torn down
+    global _session_vba_index
+    _session_vba_index = None
+
     try:
         access = win32com.client.GetActiveObject("Access.Application")
         try:
@@ -72,36 +179,458 @@ def _ensure_access_closed():
     gc.collect()
     time.sleep(Config.CLEANUP_DELAY)
 
-def _with_access_database(db_name: str, operation_func: Callable) -> Any:
+# --- Retry Policy ---
+# Transient failures (another session holding a lock, a busy COM server, a
+# driver timeout) are retried with jittered exponential backoff, bounded by
+# Config.MAX_RETRIES and Config.RETRY_DEADLINE. Anything else fails at once.
+# For COM only the launch/open step is retried (see _open_access_database).
+_TRANSIENT_HRESULTS = {
+    -2147418111: "com_busy",         # RPC_E_CALL_REJECTED
+    -2147417846: "com_busy",         # RPC_E_SERVERCALL_RETRYLATER
+    -2147023174: "com_unavailable",  # RPC_S_SERVER_UNAVAILABLE
+    -2147023170: "com_unavailable",  # RPC_E_CALL_FAILED (Access exited while starting up)
+}
+_TRANSIENT_PATTERNS = [
+    ("lock_conflict", re.compile(r"currently locked|could not lock|already in use|in use by another|opened exclusively|prevents it from being opened or locked", re.I)),
+    ("driver_timeout", re.compile(r"\bHYT0[01]\b|timeout expired|query timeout", re.I)),
+    ("com_busy", re.compile(r"call was rejected|application is busy", re.I)),
+]
+_metrics_lock = threading.Lock()
+_retry_metrics: Dict[str, Any] = {"retried_calls": 0, "recovered": 0, "exhausted": 0, "retries": {}}
+
+def _classify_transient_error(error: BaseException) -> Optional[str]:
+    """Return the transient error category of an exception, or None if it is not transient."""
+    if isinstance(error, TimeoutError):
+        return None  # a call that ran out of its deadline is never retried
+    while error is not None:
+        args = getattr(error, "args", ())
+        codes = [args[0]] if args and isinstance(args[0], int) else []
+        # DISP_E_EXCEPTION carries the real HRESULT in the excepinfo tuple
+        if len(args) > 2 and isinstance(args[2], tuple) and len(args[2]) > 5:
+            codes.append(args[2][5])
+        for code in codes:
+            if code in _TRANSIENT_HRESULTS:
+                return _TRANSIENT_HRESULTS[code]
+        message = str(error)
+        for category, pattern in _TRANSIENT_PATTERNS:
+            if pattern.search(message):
+                return category
+        error = error.__cause__
+    return None
+
+def _with_retry(func: Callable, description: str, deadline: Optional[float] = None) -> Any:
+    """Call func(), retrying transient failures with jittered exponential backoff.
+
+    Args:
+        func: Zero-argument callable to run; it must be safe to run again after a failure
+        description: Short label for log messages
+        deadline: Seconds after which no further retry is started (default: Config.RETRY_DEADLINE)
+
+    Raises:
+        Exception: The last error, once it is not transient or the retry budget is spent
+    """
+    deadline_at = time.monotonic() + (Config.RETRY_DEADLINE if deadline is None else deadline)
+    attempt = 0
+    while True:
+        try:
+            result = func()
+        except Exception as e:
+            category = _classify_transient_error(e)
+            if category is None:
+                raise
+            delay = min(Config.RETRY_DELAY * (2 ** attempt) * random.uniform(0.5, 1.5), Config.RETRY_MAX_DELAY)
+            if attempt >= Config.MAX_RETRIES or time.monotonic() + delay > deadline_at:
+                with _metrics_lock:
+                    _retry_metrics["exhausted"] += 1
+                logger.error(f"{description} still failing after {attempt} retries ({category}): {e}")
+                raise
+            with _metrics_lock:
+                if attempt == 0:
+                    _retry_metrics["retried_calls"] += 1
+                _retry_metrics["retries"][category] = _retry_metrics["retries"].get(category, 0) + 1
+            attempt += 1
+            logger.warning(f"{description} hit a transient {category} error, retry {attempt}/{Config.MAX_RETRIES} in {delay:.2f}s: {e}")
+            time.sleep(delay)
+            continue
+        if attempt:
+            with _metrics_lock:
+                _retry_metrics["recovered"] += 1
+        return result
+
+# --- Call Deadlines ---
+
+def _call_deadline(tool_name: str, timeout_seconds: Optional[float] = None) -> Optional[float]:
+    """Resolve a call's deadline in seconds: the per-call value, else the tool default; None means no deadline."""
+    seconds = timeout_seconds if timeout_seconds is not None else Config.TOOL_DEADLINES.get(tool_name, 0)
+    return seconds if seconds and seconds > 0 else None
+
+def _remaining(deadline_at: Optional[float], description: str) -> Optional[float]:
+    """Seconds left before a monotonic deadline.
+
+    Raises:
+        TimeoutError: If the deadline has already passed
+    """
+    if deadline_at is None:
+        return None
+    remaining = deadline_at - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError(f"{description} ran out of time before it could start")
+    return remaining
+
+def _access_pid(access) -> Optional[int]:
+    """Process id of an Access.Application instance, or None if it cannot be determined."""
+    try:
+        _, pid = win32process.GetWindowThreadProcessId(access.hWndAccessApp())
+        return pid or None
+    except Exception as e:
+        logger.debug(f"Could not determine Access process id: {e}")
+        return None
+
+def _terminate_process(pid: int) -> bool:
+    """Terminate a process (TerminateProcess on Windows). Returns False if it could not be killed."""
+    try:
+        os.kill(pid, signal.SIGTERM)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not terminate process {pid}: {e}")
+        return False
+
+class _ComDeadline:
+    """Terminate the Access process behind a COM call that overruns its deadline.
+
+    A blocked Access.Run cannot be interrupted from Python, so a timer kills the
+    process instead; the blocked call then fails, is reported as a TimeoutError,
+    and the next session launches a fresh instance. The guard can be entered
+    before Access is launched (access=None) and the instance attached once it
+    exists, so a hang in OpenCurrentDatabase is covered too.
+    """
+
+    def __init__(self, access, deadline_at: Optional[float], description: str):
+        self.access = access
+        self.deadline_at = deadline_at
+        self.description = description
+        self.expired = False
+        self.pid: Optional[int] = None
+        self.instance: Optional["_AccessInstance"] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def attach(self, access) -> None:
+        """Point the guard at the Access instance it should terminate on expiry."""
+        if self.deadline_at is None:
+            return
+        instance = _instance_for(access)
+        if instance is not None:
+            # The watchdog leaves a busy instance to this guard until the deadline passes
+            instance.deadline_at = self.deadline_at
+            self.instance = instance
+        self.pid = instance.pid if instance else _access_pid(access)
+        if not self.pid:
+            logger.warning(f"{self.description}: Access process id unknown, deadline not enforced")
+
+    def __enter__(self):
+        seconds = _remaining(self.deadline_at, self.description)
+        if seconds is not None:
+            if self.access is not None:
+                self.attach(self.access)
+            self._timer = threading.Timer(seconds, self._expire, args=(seconds,))
+            self._timer.daemon = True
+            self._timer.start()
+        return self
+
+    def _expire(self, seconds: float) -> None:
+        self.expired = True
+        pid = self.pid
+        if pid:
+            logger.error(f"{self.description} exceeded its {seconds:.1f}s deadline; terminating Access (PID {pid})")
+            _terminate_process(pid)
+        else:
+            logger.error(f"{self.description} exceeded its {seconds:.1f}s deadline before Access had started")
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._timer:
+            self._timer.cancel()
+        if self.instance is not None:
+            self.instance.deadline_at = None
+        if self.expired:
+            raise TimeoutError(f"{self.description} exceeded its deadline; the Access instance was terminated") from exc
+        return False
+
+# --- Access Process Watchdog ---
+# Every Access instance the server launches is registered by PID. A sweep
+# (periodic, and on demand via reap_access_instances) terminates instances that
+# were released but never exited and in-use instances whose window has stopped
+# responding, then removes the lock files they left behind.
+_PROCESS_QUERY_ACCESS = 0x0400 | 0x0010 | 0x00100000  # QUERY_INFORMATION | VM_READ | SYNCHRONIZE
+_STILL_ACTIVE = 259
+_watchdog_lock = threading.Lock()
+_watchdog_totals: Dict[str, Any] = {"sweeps": 0, "terminated": 0, "memory_reclaimed_bytes": 0, "locks_removed": 0}
+
+class _AccessInstance:
+    """An Access.Application process launched by this server."""
+
+    def __init__(self, access, pid: int, hwnd: int, db_path: str, owner: str, created: Any):
+        self.object_id = id(access)
+        self.pid = pid
+        self.hwnd = hwnd
+        self.db_path = db_path
+        self.owner = owner
+        self.created = created
+        self.started = time.time()
+        self.released: Optional[float] = None
+        self.hung_since: Optional[float] = None
+        self.deadline_at: Optional[float] = None  # monotonic deadline of the guarded call in progress
+        self.reaped = False
+
+_access_instances: Dict[int, _AccessInstance] = {}
+
+def _open_process(pid: int, created: Any = None):
+    """Open a handle to a live process, or None if it has exited or its PID was reused."""
+    try:
+        handle = win32api.OpenProcess(_PROCESS_QUERY_ACCESS, False, pid)
+    except Exception:
+        return None
+    try:
+        if win32process.GetExitCodeProcess(handle) != _STILL_ACTIVE:
+            handle.Close()
+            return None
+        if created is not None and win32process.GetProcessTimes(handle)["CreationTime"] != created:
+            handle.Close()
+            return None
+    except Exception as e:
+        logger.debug(f"Could not query process {pid}: {e}")
+    return handle
+
+def _track_access(access, db_path: str, owner: str) -> Optional[_AccessInstance]:
+    """Register a freshly launched Access instance with the watchdog."""
+    try:
+        hwnd = access.hWndAccessApp()
+        _, pid = win32process.GetWindowThreadProcessId(hwnd) if hwnd else (0, 0)
+    except Exception as e:
+        logger.debug(f"Could not register Access instance with the watchdog: {e}")
+        return None
+    if not pid:
+        logger.debug("Could not register Access instance with the watchdog: no window handle")
+        return None
+    created = None
+    handle = _open_process(pid)
+    if handle is not None:
+        try:
+            created = win32process.GetProcessTimes(handle)["CreationTime"]
+        except Exception:
+            pass
+        handle.Close()
+    instance = _AccessInstance(access, pid, hwnd, db_path, owner, created)
+    with _watchdog_lock:
+        _access_instances[pid] = instance
+    logger.debug(f"Tracking Access PID {pid} ({owner}) for {db_path}")
+    return instance
+
+def _instance_for(access) -> Optional[_AccessInstance]:
+    """The tracked, still in-use instance behind an Access.Application object."""
+    with _watchdog_lock:
+        for instance in _access_instances.values():
+            if instance.object_id == id(access) and instance.released is None:
+                return instance
+    return None
+
+def _untrack_access(access) -> None:
+    """Mark an instance as released; the watchdog terminates it if it does not exit."""
+    instance = _instance_for(access)
+    if instance is None:
+        return
+    with _watchdog_lock:
+        if instance.reaped:
+            _access_instances.pop(instance.pid, None)
+        else:
+            instance.released = time.time()
+
+def _window_responds(hwnd: int) -> bool:
+    """Ping a window with WM_NULL; False if it does not answer in time."""
+    try:
+        win32gui.SendMessageTimeout(hwnd, 0, 0, 0, 0x0002, Config.WATCHDOG_RESPONSE_TIMEOUT * 1000)  # SMTO_ABORTIFHUNG
+        return True
+    except Exception:
+        return False
+
+def _sweep_access_instances() -> Dict[str, Any]:
+    """Terminate orphaned or unresponsive Access instances and clean up their lock files.
+
+    Returns:
+        dict describing this sweep: instances checked, already exited,
+        terminated (with reason and memory), and lock files removed
+    """
+    report: Dict[str, Any] = {"checked": 0, "exited": 0, "terminated": [], "locks_removed": [],
+                              "memory_reclaimed_bytes": 0}
+    with _watchdog_lock:
+        instances = list(_access_instances.values())
+    lock_candidates = set()
+    for instance in instances:
+        report["checked"] += 1
+        now = time.time()
+        handle = _open_process(instance.pid, instance.created)
+        if handle is None:
+            report["exited"] += 1
+            lock_candidates.add(instance.db_path)
+            with _watchdog_lock:
+                if instance.released is not None or instance.reaped:
+                    _access_instances.pop(instance.pid, None)
+                else:
+                    instance.reaped = True  # died while in use; the session drops it on release
+            continue
+        try:
+            reason = None
+            if instance.reaped:
+                reason = None
+            elif instance.released is not None:
+                if now - instance.released > Config.WATCHDOG_ORPHAN_GRACE:
+                    reason = "orphaned"
+            elif not instance.hwnd:
+                pass  # window handle unknown, so the instance cannot be pinged
+            elif instance.deadline_at is not None and time.monotonic() < instance.deadline_at:
+                instance.hung_since = None  # a call deadline is in force; _ComDeadline owns this instance
+            elif _window_responds(instance.hwnd):
+                instance.hung_since = None
+            else:
+                instance.hung_since = instance.hung_since or now
+                if now - instance.hung_since > Config.WATCHDOG_HUNG_SECONDS:
+                    reason = "unresponsive"
+            if reason is None:
+                continue
+            try:
+                memory = win32process.GetProcessMemoryInfo(handle)["WorkingSetSize"]
+            except Exception:
+                memory = 0
+            logger.warning(f"Watchdog terminating {reason} Access PID {instance.pid} ({instance.owner}, {instance.db_path})")
+            if not _terminate_process(instance.pid):
+                continue
+            win32event.WaitForSingleObject(handle, 5000)
+            with _watchdog_lock:
+                instance.reaped = True
+                if instance.released is not None:
+                    _access_instances.pop(instance.pid, None)
+            report["terminated"].append({"pid": instance.pid, "reason": reason, "owner": instance.owner,
+                                         "database": instance.db_path, "memory_bytes": memory})
+            report["memory_reclaimed_bytes"] += memory
+            lock_candidates.add(instance.db_path)
+        finally:
+            handle.Close()
+
+    for db_path in filter(None, lock_candidates):
+        info = _inspect_lock(db_path)
+        if info["exists"] and _clear_stale_lock(info):
+            report["locks_removed"].append(info["lock_file"])
+
+    with _watchdog_lock:
+        _watchdog_totals["sweeps"] += 1
+        _watchdog_totals["terminated"] += len(report["terminated"])
+        _watchdog_totals["memory_reclaimed_bytes"] += report["memory_reclaimed_bytes"]
+        _watchdog_totals["locks_removed"] += len(report["locks_removed"])
+    return report
+
+def _watchdog_loop() -> None:
+    while True:
+        time.sleep(Config.WATCHDOG_INTERVAL)
+        try:
+            report = _sweep_access_instances()
+            if report["terminated"] or report["locks_removed"]:
+                logger.info(f"Watchdog reclaimed {len(report['terminated'])} Access processes "
+                            f"({report['memory_reclaimed_bytes'] // 1024} KB) and {len(report['locks_removed'])} lock files")
+        except Exception as e:
+            logger.warning(f"Watchdog sweep failed: {e}")
+
+def _start_watchdog() -> None:
+    """Start the background watchdog thread unless Config.WATCHDOG_INTERVAL is 0."""
+    if Config.WATCHDOG_INTERVAL > 0:
+        threading.Thread(target=_watchdog_loop, name="access-watchdog", daemon=True).start()
+
+def _with_access_database(db_name: str, operation_func: Callable, deadline: Optional[float] = None) -> Any:
     """Context manager pattern for Access operations with automatic cleanup
+
+    Transient failures (lock conflicts, a busy or vanished COM server) while
+    launching Access and opening the database are retried. Once operation_func
+    has started nothing is retried, since its VBA calls and writes may already
+    have taken effect.
     
     Args:
         db_name: Database name or path
         operation_func: Function that takes access object and returns result
+        deadline: Optional seconds the call (including retries) may take; the
+            Access instance is terminated if operation_func overruns it
         
     Returns:
         Result from operation_func
         
     Raises:
-        Exception: If operation fails after retries
+        TimeoutError: If the deadline is exceeded
+        Exception: If the database cannot be opened after retries, or operation fails
     """
+    global _batch_mode_access, _batch_mode_db
+    description = f"Access session on {db_name}"
+    deadline_at = time.monotonic() + deadline if deadline else None
+
+    # Check if in batch mode
+    if _batch_mode_access and _batch_mode_db == db_name:
+        logger.debug(f"Using existing batch connection for {db_name}")
+        instance = _instance_for(_batch_mode_access)
+        if instance is not None and instance.reaped:
+            _untrack_access(_batch_mode_access)
+            _batch_mode_access = None
+            _batch_mode_db = None
+            raise TimeoutError("The batch Access instance was terminated by the watchdog; start a new batch operation")
+        guard = _ComDeadline(_batch_mode_access, deadline_at, description)
+        try:
+            with guard:
+                return operation_func(_batch_mode_access)
+        finally:
+            if guard.expired:
+                # The batch instance is gone; later calls open their own sessions
+                _batch_mode_access = None
+                _batch_mode_db = None
+
+    return _run_access_session(db_name, operation_func, deadline_at)
+
+def _open_access_database(path: str, guard: Optional[_ComDeadline] = None) -> Any:
+    """Launch Access and open a database, closing the instance again if opening fails.
+
+    This is the only step the retry policy repeats: nothing has run against the
+    database yet, so a retry cannot replay user work.
+    """
+    access = win32com.client.Dispatch("Access.Application")
+    _track_access(access, path, "session")
+    if guard is not None:
+        guard.attach(access)
+    try:
+        access.Visible = False
+        access.OpenCurrentDatabase(path)
+    except Exception as e:
+        _untrack_access(access)
+        try:
+            access.Quit(2)  # acQuitSaveNone
+        except Exception as e:
+            logger.debug(f"Error quitting after failed open (may be expected): {e}")
+        del access
+        _ensure_access_closed()
+        if guard is not None and guard.expired:
+            raise TimeoutError(f"Opening {path} exceeded its deadline; the Access instance was terminated") from e
+        raise
+    return access
+
+def _run_access_session(db_name: str, operation_func: Callable, deadline_at: Optional[float] = None) -> Any:
+    """Open the database in a new Access instance, run operation_func, then save and close."""
     path = get_db_path(db_name)
     access = None
+    instance = None
     
     try:
-        # Check if in batch mode
-        global _batch_mode_access, _batch_mode_db
-        if _batch_mode_access and _batch_mode_db == db_name:
-            logger.debug(f"Using existing batch connection for {db_name}")
-            return operation_func(_batch_mode_access)
-        
         # Normal mode - open, execute, close
+        _release_pooled_connection(path)
         logger.info(f"Opening database: {path}")
-        access = win32com.client.Dispatch("Access.Application")
-        access.Visible = False
-        access.OpenCurrentDatabase(path)
-        
-        result = operation_func(access)
+        retry_window = None if deadline_at is None else max(0.0, deadline_at - time.monotonic())
+        # The deadline guard starts before the launch, so a hung open is terminated too
+        with _ComDeadline(None, deadline_at, f"Access session on {db_name}") as guard:
+            access = _with_retry(lambda: _open_access_database(path, guard), f"Opening {db_name}", retry_window)
+            instance = _instance_for(access)
+            result = operation_func(access)
         
         # Save and close
         try:
@@ -118,11 +647,15 @@ def _with_access_database(db_name: str, operation_func: Callable) -> Any:
         
     except win32com.client.pywintypes.com_error as e:
         logger.error(f"COM error in database operation: {e}")
-        raise Exception(f"COM error: {str(e)}")
+        if instance is not None and instance.reaped:
+            raise TimeoutError("Access stopped responding and was terminated by the watchdog") from e
+        raise Exception(f"COM error: {str(e)}") from e
     except Exception as e:
         logger.error(f"Error in database operation: {e}")
         raise
     finally:
+        if access is not None:
+            _untrack_access(access)
         if access and not _batch_mode_access:
             try:
                 access.Quit(1)
@@ -131,8 +664,237 @@ def _with_access_database(db_name: str, operation_func: Callable) -> Any:
             del access
             _ensure_access_closed()
 
+# Access object type constants (AcObjectType)
+AC_QUERY = 1
+AC_FORM = 2
+AC_REPORT = 3
+AC_MACRO = 4
+AC_MODULE = 5
+
+# DoCmd.RunCommand constants (AcCommand)
+AC_CMD_COMPILE_ALL_MODULES = 125  # compile only, nothing saved
+AC_CMD_COMPILE_AND_SAVE_ALL_MODULES = 126
+
+_AC_TYPE_NAMES = {AC_QUERY: "Query", AC_FORM: "Form", AC_REPORT: "Report", AC_MACRO: "Macro", AC_MODULE: "Module"}
+
+def _load_object_from_file(access, object_type: int, object_name: str, file_path: str) -> None:
+    """Replace an object in the open database with a SaveAsText file."""
+    kind = _AC_TYPE_NAMES.get(object_type, "Object")
+
+    # Delete existing object if it exists
+    try:
+        access.DoCmd.DeleteObject(object_type, object_name)
+        logger.debug(f"Deleted existing {kind.lower()}: {object_name}")
+    except Exception:
+        logger.debug(f"{kind} {object_name} doesn't exist (creating new)")
+
+    # Modules and form/report code-behind are VBComponents; cached ones are now stale
+    _invalidate_vba_index(access)
+
+    # Load object from text file
+    access.LoadFromText(object_type, object_name, file_path)
+    logger.info(f"{kind} '{object_name}' created successfully")
+
+# Object types handled by export/sync: (AcObjectType, sub-directory, file extension)
+_DESIGN_OBJECT_TYPES = {
+    "form": (AC_FORM, "forms", ".txt"),
+    "report": (AC_REPORT, "reports", ".txt"),
+    "query": (AC_QUERY, "queries", ".txt"),
+    "macro": (AC_MACRO, "macros", ".txt"),
+    "module": (AC_MODULE, "modules", ".bas"),
+}
+_MANIFEST_FILE = "manifest.json"
+
+def _safe_file_name(name: str) -> str:
+    """Make an Access object name usable as a file name."""
+    return re.sub(r'[<>:"/\\|?*]', '_', name)
+
+def _hash_file(path: str) -> Tuple[str, int]:
+    """SHA-256 and size of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(65536), b""):
+            digest.update(block)
+    return digest.hexdigest(), os.path.getsize(path)
+
+def _list_design_objects(access, object_type: str) -> List[str]:
+    """Names of all objects of one type in the open database."""
+    if object_type == "query":
+        # '~' queries are hidden, Access-generated queries behind forms/controls
+        return [q.Name for q in access.CurrentDb().QueryDefs if not q.Name.startswith("~")]
+    collection = {
+        "form": access.CurrentProject.AllForms,
+        "report": access.CurrentProject.AllReports,
+        "macro": access.CurrentProject.AllMacros,
+        "module": access.CurrentProject.AllModules,
+    }[object_type]
+    return [collection.Item(i).Name for i in range(collection.Count)]
+
+class _ScratchArea:
+    """Process-wide scratch directory for files handed to LoadFromText.
+
+    The directory is created once (under Config.SCRATCH_DIR if it exists,
+    otherwise the system temp dir) and removed at exit, instead of creating
+    and deleting a NamedTemporaryFile per object. Files only stay off the
+    physical disk when MSACCESS_MCP_SCRATCH_DIR is on a RAM disk.
+    """
+
+    def __init__(self):
+        self._directory: Optional[str] = None
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+
+    @property
+    def encoding(self) -> str:
+        return "utf-16" if Config.SCRATCH_UTF16 else "utf-8"
+
+    def directory(self) -> str:
+        with self._lock:
+            if self._directory is None or not os.path.isdir(self._directory):
+                base = Config.SCRATCH_DIR if Config.SCRATCH_DIR and os.path.isdir(Config.SCRATCH_DIR) else None
+                self._directory = tempfile.mkdtemp(prefix="access_mcp_", dir=base)
+                logger.debug(f"Scratch directory: {self._directory}")
+            return self._directory
+
+    def write(self, text: str, suffix: str = ".txt") -> str:
+        """Write text to a new scratch file and return its path."""
+        path = os.path.join(self.directory(), f"{next(self._counter):06d}{suffix}")
+        with open(path, "w", encoding=self.encoding) as f:
+            f.write(text)
+        return path
+
+    def write_many(self, texts: List[str], suffix: str = ".txt") -> List[str]:
+        """Write a batch of texts up front, returning their paths in order."""
+        return [self.write(text, suffix) for text in texts]
+
+    def remove(self, paths: List[str]) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def cleanup(self) -> None:
+        with self._lock:
+            if self._directory:
+                shutil.rmtree(self._directory, ignore_errors=True)
+                self._directory = None
+
+_scratch = _ScratchArea()
+atexit.register(_scratch.cleanup)
+
+def _load_object_from_text(access, object_type: int, object_name: str, text: str) -> None:
+    """Replace a form/report in the open database with a SaveAsText definition.
+
+    Args:
+        access: Access.Application with the target database open
+        object_type: AC_FORM or AC_REPORT
+        object_name: Name to save the object as
+        text: Complete SaveAsText definition
+    """
+    file_path = _scratch.write(text)
+    try:
+        _load_object_from_file(access, object_type, object_name, file_path)
+    finally:
+        _scratch.remove([file_path])
+
+_LOCK_SLOT_SIZE = 64  # each lock file slot is a 32-byte machine name + 32-byte user name
+_LOCK_NAME_SIZE = 32
+_LOCK_POLICIES = ("wait", "fail", "shared")
+
+def _lock_file_path(db_path: str) -> str:
+    """Return the lock file Access creates next to a database (.laccdb or .ldb)"""
+    root, ext = os.path.splitext(db_path)
+    return root + ('.ldb' if ext.lower() == '.mdb' else '.laccdb')
+
+def _decode_lock_name(raw: bytes) -> str:
+    """Decode one null-padded name field from a lock file slot"""
+    raw = raw.split(b'\x00', 1)[0]
+    return raw.decode('mbcs' if sys.platform == 'win32' else 'latin-1', errors='replace').strip()
+
+def _parse_lock_slots(data: bytes) -> List[Dict[str, str]]:
+    """Parse the machine/user slots recorded in a lock file.
+
+    Access appends a slot for every session that opens the database and does not
+    clear it on close, so slots are the sessions seen since the lock file was
+    created, not necessarily the current holders.
+    """
+    slots = []
+    seen = set()
+    for offset in range(0, len(data) - _LOCK_SLOT_SIZE + 1, _LOCK_SLOT_SIZE):
+        slot = data[offset:offset + _LOCK_SLOT_SIZE]
+        machine = _decode_lock_name(slot[:_LOCK_NAME_SIZE])
+        user = _decode_lock_name(slot[_LOCK_NAME_SIZE:])
+        if not machine and not user:
+            continue
+        if (machine, user) in seen:
+            continue
+        seen.add((machine, user))
+        slots.append({"machine": machine, "user": user})
+    return slots
+
+def _is_lock_file_held(lock_file: str) -> bool:
+    """Check whether any process still has the lock file open.
+
+    Access keeps the lock file open for as long as a session is attached, so an
+    open that shares nothing fails with a sharing violation until every holder
+    is gone. The probe handle is closed at once and never changes the file.
+    """
+    try:
+        handle = win32file.CreateFile(lock_file, win32file.GENERIC_READ, 0, None,
+                                      win32file.OPEN_EXISTING, 0, None)
+    except Exception as e:
+        # ERROR_FILE_NOT_FOUND / ERROR_PATH_NOT_FOUND: the holder closed and removed it
+        if getattr(e, "winerror", None) in (2, 3):
+            return False
+        # ERROR_SHARING_VIOLATION, or anything unexpected: assume it is held
+        return True
+    handle.Close()
+    return False
+
+def _inspect_lock(db_path: str) -> Dict[str, Any]:
+    """Describe the lock file of a database: who recorded it and whether it is stale"""
+    _release_pooled_connection(db_path)
+    lock_file = _lock_file_path(db_path)
+    info: Dict[str, Any] = {"lock_file": lock_file, "exists": False, "stale": False, "holders": []}
+    try:
+        with open(lock_file, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return info
+    except OSError as e:
+        # Unreadable means someone holds it; report it as held with no slot data
+        info.update(exists=True, read_error=str(e))
+        return info
+    info["exists"] = True
+    info["holders"] = _parse_lock_slots(data)
+    info["stale"] = not _is_lock_file_held(lock_file)
+    return info
+
+def _describe_lock_holders(info: Dict[str, Any]) -> str:
+    """Format lock holders for error messages"""
+    holders = [f"{h['user'] or '?'}@{h['machine'] or '?'}" for h in info.get("holders", [])]
+    return ", ".join(holders) if holders else "an unknown session"
+
+def _clear_stale_lock(info: Dict[str, Any]) -> bool:
+    """Delete a lock file left behind by a session that no longer exists"""
+    if not (Config.CLEAR_STALE_LOCKS and info.get("stale")):
+        return False
+    try:
+        os.remove(info["lock_file"])
+    except FileNotFoundError:
+        return True
+    except OSError as e:
+        logger.warning(f"Could not remove stale lock file {info['lock_file']}: {e}")
+        return False
+    logger.info(f"Removed stale lock file {info['lock_file']} (last recorded: {_describe_lock_holders(info)})")
+    return True
+
 def is_database_locked(db_path: str) -> bool:
     """Check if database has an active lock file
+
+    Our own pooled ODBC connection is released first so it is never mistaken
+    for a foreign lock holder.
     
     Args:
         db_path: Full path to database file
@@ -140,40 +902,62 @@ def is_database_locked(db_path: str) -> bool:
     Returns:
         True if lock file exists, False otherwise
     """
-    lock_file = db_path.replace('.accdb', '.laccdb')
+    _release_pooled_connection(db_path)
+    lock_file = _lock_file_path(db_path)
     locked = os.path.exists(lock_file)
     if locked:
         logger.warning(f"Database is locked: {lock_file}")
     return locked
 
-def wait_for_lock_release(db_path: str, timeout: Optional[int] = None) -> Tuple[bool, str]:
+def wait_for_lock_release(db_path: str, timeout: Optional[int] = None,
+                          policy: Optional[str] = None, read_only: bool = False) -> Tuple[bool, str]:
     """Wait for lock file to be released
+
+    Lock files left behind by crashed sessions are removed instead of waited on.
     
     Args:
         db_path: Full path to database file
         timeout: Maximum seconds to wait (default: Config.LOCK_TIMEOUT)
+        policy: "wait", "fail" or "shared" (default: Config.LOCK_POLICY)
+        read_only: The caller only reads, so the "shared" policy lets it proceed
         
     Returns:
         Tuple of (success: bool, message: str)
     """
     if timeout is None:
         timeout = Config.LOCK_TIMEOUT
-        
-    lock_file = db_path.replace('.accdb', '.laccdb')
+    policy = (policy or Config.LOCK_POLICY).lower()
+    if policy not in _LOCK_POLICIES:
+        policy = "wait"
+
+    info = _inspect_lock(db_path)
+    lock_file = info["lock_file"]
     
-    if not os.path.exists(lock_file):
+    if not info["exists"]:
         return True, "Database is not locked"
+    if _clear_stale_lock(info):
+        return True, "Removed stale lock file"
+
+    holders = _describe_lock_holders(info)
+    if read_only and policy == "shared":
+        logger.info(f"Opening {db_path} (shared) for a read-only tool alongside {holders}")
+        return True, f"Database is in use by {holders}; proceeding with a shared open because this tool only reads"
+    if policy == "fail":
+        return False, f"Database is locked by {holders}"
     
-    logger.info(f"Waiting for lock release: {lock_file} (timeout: {timeout}s)")
+    logger.info(f"Waiting for lock release: {lock_file} held by {holders} (timeout: {timeout}s)")
     start_time = time.time()
     
     while os.path.exists(lock_file):
         elapsed = time.time() - start_time
         if elapsed > timeout:
-            msg = f"Timeout: Database still locked after {timeout} seconds. Please close MS Access manually."
+            msg = f"Timeout: Database still locked by {holders} after {timeout} seconds. Please close MS Access manually."
             logger.error(msg)
             return False, msg
         time.sleep(Config.POLL_INTERVAL)
+        info = _inspect_lock(db_path)
+        if _clear_stale_lock(info):
+            break
     
     logger.info(f"Lock released after {time.time() - start_time:.1f} seconds")
     return True, "Lock released"
@@ -250,8 +1034,17 @@ def get_db_path(db_name: str) -> str:
     # 3. If neither exists, default to current directory (for new database creation)
     return current_dir_path
 
+_driver_name: Optional[str] = None
+
 def get_driver() -> str:
-    """Finds a suitable Microsoft Access ODBC driver."""
+    """Finds a suitable Microsoft Access ODBC driver.
+
+    The lookup enumerates every installed ODBC driver, so the result is cached
+    for the lifetime of the process.
+    """
+    global _driver_name
+    if _driver_name:
+        return _driver_name
     drivers = pyodbc.drivers()
     for d in [
         "Microsoft Access Driver (*.mdb, *.accdb)",
@@ -259,54 +1052,573 @@ def get_driver() -> str:
         "Microsoft Access Driver (*.mdb)"
     ]:
         if d in drivers:
+            _driver_name = d
             return d
     raise Exception("Access ODBC driver not found")
 
+def _connection_string(db_path: str, read_only: bool = False) -> str:
+    """Build the ODBC connection string for a database file.
 
+    The read-only profile opens the file shared and without write access, so
+    SELECT traffic does not contend with writers or an Access design session.
+    """
+    conn_str = f"DRIVER={{{get_driver()}}};DBQ={db_path};"
+    if read_only:
+        conn_str += "ReadOnly=1;Exclusive=0;"
+    return conn_str
+
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\]")
+
+def _is_read_only_sql(sql: str) -> bool:
+    """True for SELECT/TRANSFORM statements that do not write (excludes SELECT ... INTO)."""
+    stripped = _LITERAL_PATTERN.sub("", sql).strip().lower()
+    if not stripped.startswith(("select", "transform")):
+        return False
+    return re.search(r"\binto\b", stripped) is None
 
-def _run_query_internal(db_name: str, sql: str) -> str:
-    """Internal helper to run any SQL query."""
-    path = get_db_path(db_name)
-    driver = get_driver()
-    conn_str = f"DRIVER={{{driver}}};DBQ={path};"
 
+
+def _format_result_line(row: Any) -> str:
+    """Format one row for the fixed-width text table returned by query tools."""
+    return " | ".join(f"{str(val):<15}" for val in row)
+
+def _format_result_rows(columns: List[str], rows: List[Any]) -> str:
+    """Format fetched rows as the fixed-width text table returned by query tools."""
+    lines = [
+        f"Query Results ({len(rows)} rows):",
+        " | ".join(f"{col:<15}" for col in columns),
+        "-" * (len(columns) * 17),
+    ]
+    lines.extend(_format_result_line(row) for row in rows)
+    return "\n".join(lines) + "\n"
+
+# --- ODBC Connection Pool ---
+# One open connection per database file and profile (read-write or read-only),
+# each with an LRU cache of cursors keyed by SQL text. pyodbc keeps the last
+# prepared statement on a cursor, so running the same statement text on the
+# same cursor skips the driver's parse/prepare. _pool_lock only guards the pool
+# and parked results; each connection has its own lock held while it is in use.
+_pool_lock = threading.RLock()
+_connection_pool: Dict[Tuple[str, bool], "_PooledConnection"] = {}
+
+def _close_quietly(cursor) -> None:
     try:
-        with pyodbc.connect(conn_str) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql)
+        cursor.close()
+    except Exception:
+        pass
 
-            if sql.strip().lower().startswith("select"):
-                columns = [col[0] for col in cursor.description]
-                rows = cursor.fetchall()
-                if rows:
-                    result = f"Query Results ({len(rows)} rows):\n"
-                    result += " | ".join(f"{col:<15}" for col in columns) + "\n"
-                    result += "-" * (len(columns) * 17) + "\n"
-                    for row in rows:
-                        result += " | ".join(f"{str(val):<15}" for val in row) + "\n"
-                    return result
-                else:
-                    return "No results found"
-            else:
-                conn.commit()
-                return "Query executed successfully"
+class _PooledConnection:
+    """An open ODBC connection plus its prepared-statement (cursor) cache."""
+
+    def __init__(self, conn, read_only: bool = False):
+        self.conn = conn
+        self.read_only = read_only
+        self.lock = threading.Lock()  # held while a caller executes or fetches on this connection
+        self.statements: "OrderedDict[str, Any]" = OrderedDict()
+        self.statement_timeouts: Dict[str, int] = {}
+        self.timeout = 0
+        self.last_used = time.time()
+        self.hits = 0
+        self.misses = 0
+        self.closed = False
+
+    def set_timeout(self, timeout: int) -> None:
+        """Set the query timeout (seconds, 0 = none) for cursors used from now on.
+
+        pyodbc copies Connection.timeout onto a cursor only when the cursor is
+        created, so cursor_for replaces cached cursors made under another timeout.
+        """
+        self.timeout = timeout
+        self.conn.timeout = timeout
+
+    def cursor_for(self, sql: str):
+        """Return the cursor that last prepared this statement text, creating it if needed."""
+        cursor = self.statements.pop(sql, None)
+        if cursor is not None and self.statement_timeouts.get(sql) != self.timeout:
+            _close_quietly(cursor)
+            cursor = None
+        if cursor is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            cursor = self.conn.cursor()
+            self.statement_timeouts[sql] = self.timeout
+            if len(self.statements) >= Config.STATEMENT_CACHE_SIZE:
+                evicted_sql, evicted = self.statements.popitem(last=False)
+                self.statement_timeouts.pop(evicted_sql, None)
+                _close_quietly(evicted)
+        self.statements[sql] = cursor
+        return cursor
+
+    def detach(self, sql: str):
+        """Remove a statement's cursor from the cache so a later execute cannot reuse it."""
+        self.statement_timeouts.pop(sql, None)
+        return self.statements.pop(sql, None)
+
+    def close(self):
+        self.closed = True
+        for cursor in self.statements.values():
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self.statements.clear()
+        try:
+            self.conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled connection (may be expected): {e}")
+
+def _close_pooled(pooled: _PooledConnection) -> None:
+    """Close a connection already removed from the pool, once any call running on it finishes."""
+    with pooled.lock:
+        pooled.close()
+
+def _release_pooled_connection(db_path: str) -> None:
+    """Close the pooled ODBC connections (both profiles) for a database file."""
+    with _pool_lock:
+        released = [(read_only, _connection_pool.pop((os.path.normcase(db_path), read_only), None))
+                    for read_only in (False, True)]
+    for read_only, pooled in released:
+        if pooled:
+            _close_pooled(pooled)
+            logger.debug(f"Released pooled ODBC connection: {db_path} (read_only={read_only})")
+
+def _with_pooled_connection(db_path: str, operation_func: Callable, read_only: bool = False,
+                            deadline: Optional[float] = None) -> Any:
+    """Run operation_func(pooled) on the pooled ODBC connection for db_path.
+
+    read_only selects the shared read-only connection profile, which is pooled
+    separately from the read-write connection. Connections idle longer than
+    Config.CONNECTION_IDLE_TIMEOUT are closed on the way in. A connection that
+    raises is discarded rather than reused, since its transaction or cursor
+    state is unknown; uncommitted work is rolled back with it, so transient
+    failures are retried on a fresh connection. deadline (seconds) bounds the
+    call including retries and is applied as the driver's query timeout.
+    """
+    description = f"ODBC call on {os.path.basename(db_path)}"
+    deadline_at = time.monotonic() + deadline if deadline else None
+    return _with_retry(lambda: _run_pooled(db_path, operation_func, read_only, _remaining(deadline_at, description)),
+                       description, deadline)
+
+def _acquire_pooled(db_path: str, read_only: bool) -> _PooledConnection:
+    """Look up (or open) the pooled connection for a database and lock it for the caller.
+
+    _pool_lock only guards the pool dictionary; connecting and executing happen
+    outside it, so a long query on one connection does not stall the others.
+    """
+    key = (os.path.normcase(db_path), read_only)
+    while True:
+        with _pool_lock:
+            now = time.time()
+            idle = []
+            for idle_key, p in list(_connection_pool.items()):
+                # A connection whose lock is taken is in use, whatever its last_used says
+                if now - p.last_used > Config.CONNECTION_IDLE_TIMEOUT and p.lock.acquire(blocking=False):
+                    _connection_pool.pop(idle_key)
+                    idle.append(p)
+            pooled = _connection_pool.get(key)
+        for p in idle:
+            p.close()
+            p.lock.release()
+
+        if pooled is None:
+            conn = pyodbc.connect(_connection_string(db_path, read_only), readonly=read_only)
+            fresh = _PooledConnection(conn, read_only)
+            with _pool_lock:
+                pooled = _connection_pool.setdefault(key, fresh)
+            if pooled is not fresh:
+                fresh.close()  # another caller connected first
+
+        pooled.lock.acquire()
+        if not pooled.closed:
+            return pooled
+        # Released or discarded while we waited; look it up again
+        pooled.lock.release()
+
+def _discard_read_connection(db_path: str) -> None:
+    """Close the read-only connection of a database after a write on its read-write one.
+
+    Jet/ACE caches pages per connection, so a separate read connection can keep
+    returning pre-write data for a while; a fresh one reads the committed pages.
+    Results still parked on the old connection are cancelled with it.
+    """
+    with _pool_lock:
+        pooled = _connection_pool.pop((os.path.normcase(db_path), True), None)
+    if pooled:
+        _close_pooled(pooled)
+        logger.debug(f"Discarded read-only connection after write: {db_path}")
+
+def _run_pooled(db_path: str, operation_func: Callable, read_only: bool, timeout: Optional[float] = None) -> Any:
+    """Single attempt of _with_pooled_connection."""
+    key = (os.path.normcase(db_path), read_only)
+    result = _run_on_pooled(key, db_path, operation_func, read_only, timeout)
+    if not read_only:
+        # Only writes use the read-write profile; make later reads see them
+        _discard_read_connection(db_path)
+    return result
+
+def _run_on_pooled(key: Tuple[str, bool], db_path: str, operation_func: Callable, read_only: bool,
+                   timeout: Optional[float]) -> Any:
+    pooled = _acquire_pooled(db_path, read_only)
+    try:
+        # Cursors pick up the connection's query timeout when they are created
+        pooled.set_timeout(max(1, round(timeout)) if timeout else 0)
+        try:
+            result = operation_func(pooled)
+        except Exception as e:
+            with _pool_lock:
+                if _connection_pool.get(key) is pooled:
+                    _connection_pool.pop(key)
+            pooled.close()
+            if timeout and _classify_transient_error(e) == "driver_timeout":
+                raise TimeoutError(f"Query exceeded its {timeout:.0f}s deadline and was cancelled") from e
+            raise
+        pooled.last_used = time.time()
+        return result
+    finally:
+        pooled.lock.release()
+
+_NAMED_PARAM_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\[[^\]]*\]|#[^#]*#|:([A-Za-z_]\w*)")
+
+def _bind_query_params(sql: str, params: Optional[list | dict]) -> Tuple[str, List[Any]]:
+    """Convert positional or named parameters into pyodbc '?' markers.
+
+    Positional parameters are passed through unchanged. Named parameters are
+    written as ':name' in the SQL and rewritten to '?' in order of appearance;
+    string literals, [bracketed] identifiers and #date# literals are skipped.
+
+    Raises:
+        ValueError: If a named parameter in the SQL has no value
+    """
+    if params is None:
+        return sql, []
+    if isinstance(params, (list, tuple)):
+        return sql, list(params)
+
+    values: List[Any] = []
+    lookup = {str(k).lstrip(":").lower(): v for k, v in params.items()}
+
+    def replace(match):
+        name = match.group(1)
+        if name is None:
+            return match.group(0)
+        if name.lower() not in lookup:
+            raise ValueError(f"Missing value for named parameter ':{name}'")
+        values.append(lookup[name.lower()])
+        return "?"
+
+    return _NAMED_PARAM_PATTERN.sub(replace, sql), values
+
+# --- Read Replicas ---
+# Analytic SELECTs can run against a copy of the database file instead of the
+# live one, so long reporting queries never hold locks that writers wait on.
+# A copy is refreshed only when the source's mtime has changed and the current
+# copy is older than the staleness bound.
+_snapshot_lock = threading.Lock()
+_snapshot_directory: Optional[str] = None
+_snapshots: Dict[str, List["_Snapshot"]] = {}
+
+class _Snapshot:
+    """One read-replica copy of a database file."""
+
+    def __init__(self, path: str, source_mtime: float):
+        self.path = path
+        self.source_mtime = source_mtime
+        self.created = time.time()
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created
+
+def _copy_snapshot(db_path: str) -> _Snapshot:
+    """Copy a database file into the snapshot directory.
+
+    The copy is retried if the source changes while it is being read, since a
+    copy taken mid-write may be inconsistent.
+    """
+    global _snapshot_directory
+    if _snapshot_directory is None or not os.path.isdir(_snapshot_directory):
+        _snapshot_directory = tempfile.mkdtemp(prefix="access_mcp_snapshots_", dir=Config.SNAPSHOT_DIR or None)
+
+    base, ext = os.path.splitext(os.path.basename(db_path))
+    for attempt in range(Config.MAX_RETRIES):
+        mtime = os.path.getmtime(db_path)
+        target = os.path.join(_snapshot_directory, f"{base}.{uuid.uuid4().hex[:8]}{ext}")
+        start = time.perf_counter()
+        shutil.copyfile(db_path, target)
+        if os.path.getmtime(db_path) == mtime:
+            logger.info(f"Snapshot of {db_path} taken in {time.perf_counter() - start:.2f}s: {target}")
+            return _Snapshot(target, mtime)
+        os.remove(target)
+        logger.debug(f"{db_path} changed during snapshot copy (attempt {attempt + 1})")
+    raise Exception(f"Database kept changing while it was copied for a snapshot: {db_path}")
+
+def _discard_snapshot(snapshot: _Snapshot) -> None:
+    """Close connections to a snapshot and delete its file."""
+    _release_pooled_connection(snapshot.path)
+    for path in (snapshot.path, _lock_file_path(snapshot.path)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove snapshot file {path}: {e}")
+
+def _get_snapshot(db_path: str, max_staleness: Optional[float] = None) -> _Snapshot:
+    """Return a snapshot of db_path no staler than max_staleness seconds.
+
+    An unchanged database keeps its snapshot indefinitely; a changed one is
+    copied again once the snapshot is older than the bound.
+    """
+    bound = Config.SNAPSHOT_MAX_STALENESS if max_staleness is None else max_staleness
+    with _snapshot_lock:
+        generations = _snapshots.setdefault(os.path.normcase(db_path), [])
+        current = generations[-1] if generations else None
+        if current and (current.source_mtime == os.path.getmtime(db_path) or current.age <= bound):
+            return current
+        snapshot = _copy_snapshot(db_path)
+        generations.append(snapshot)
+        while len(generations) > Config.SNAPSHOT_GENERATIONS:
+            _discard_snapshot(generations.pop(0))
+        return snapshot
+
+def _cleanup_snapshots() -> None:
+    """Delete every snapshot taken by this process."""
+    with _snapshot_lock:
+        for generations in _snapshots.values():
+            for snapshot in generations:
+                _discard_snapshot(snapshot)
+        _snapshots.clear()
+        if _snapshot_directory:
+            shutil.rmtree(_snapshot_directory, ignore_errors=True)
+
+atexit.register(_cleanup_snapshots)
+
+# --- Result Size Guard ---
+# SELECT results are fetched in batches and stop at the row, byte or time limit.
+# The rest of a truncated result stays on its cursor under a continuation handle
+# until fetch_more_results drains it or the handle expires and is cancelled.
+_open_results: "OrderedDict[str, _OpenResult]" = OrderedDict()
+
+class _OpenResult:
+    """A truncated SELECT whose cursor is parked for fetch_more_results."""
+
+    def __init__(self, pooled, cursor, columns: List[str], leftover, returned: int):
+        self.pooled = pooled
+        self.cursor = cursor
+        self.columns = columns
+        self.leftover = leftover
+        self.returned = returned
+        self.created = time.time()
+
+    def cancel(self):
+        try:
+            self.cursor.cancel()
+            self.cursor.close()
+        except Exception as e:
+            logger.debug(f"Error cancelling parked cursor (may be expected): {e}")
+
+def _expire_open_results() -> List[_OpenResult]:
+    """Remove parked results that are too old or exceed Config.MAX_OPEN_RESULTS.
+
+    Called with _pool_lock held. The removed results are returned rather than
+    cancelled here; pass them to _cancel_open_results once _pool_lock (and any
+    connection lock) is released.
+    """
+    now = time.time()
+    expired = [_open_results.pop(h) for h in [h for h, r in _open_results.items()
+                                              if now - r.created > Config.RESULT_HANDLE_TTL or r.pooled.closed]]
+    while len(_open_results) > Config.MAX_OPEN_RESULTS:
+        expired.append(_open_results.popitem(last=False)[1])
+    return expired
+
+def _cancel_open_results(results: List[_OpenResult]) -> None:
+    """Cancel parked results, each under its own connection's lock."""
+    for result in results:
+        with result.pooled.lock:
+            result.cancel()
+
+def _check_result_limits(max_rows: Optional[int], max_bytes: Optional[int], max_seconds: Optional[float]) -> Optional[str]:
+    """Return an error message for a per-call limit that could never return a row, else None."""
+    for name, value in (("max_rows", max_rows), ("max_bytes", max_bytes)):
+        if value is not None and value < 1:
+            return f"Error: {name} must be at least 1"
+    if max_seconds is not None and max_seconds <= 0:
+        return "Error: max_seconds must be greater than 0"
+    return None
+
+def _result_limits(max_rows: Optional[int], max_bytes: Optional[int], max_seconds: Optional[float]) -> Tuple[int, int, float]:
+    """Resolve per-call limits; the Config values are hard caps that calls can only lower."""
+    return (
+        min(max_rows, Config.MAX_RESULT_ROWS) if max_rows else Config.MAX_RESULT_ROWS,
+        min(max_bytes, Config.MAX_RESULT_BYTES) if max_bytes else Config.MAX_RESULT_BYTES,
+        min(max_seconds, Config.MAX_FETCH_SECONDS) if max_seconds else Config.MAX_FETCH_SECONDS,
+    )
+
+def _fetch_result_page(cursor, leftover, max_rows: int, max_bytes: int, max_seconds: float) -> Tuple[List[str], Optional[str], Any]:
+    """Fetch and format rows until the cursor is exhausted or a limit is reached.
+
+    Returns:
+        Tuple of (formatted row lines, truncation reason or None, unreturned rows
+        already pulled from the driver)
+    """
+    lines: List[str] = []
+    size = 0
+    deadline = time.perf_counter() + max_seconds
+    buffer = deque(leftover)
+    while True:
+        if not buffer:
+            buffer.extend(cursor.fetchmany(Config.FETCH_BATCH_SIZE))
+            if not buffer:
+                return lines, None, buffer
+        if len(lines) >= max_rows:
+            return lines, f"row limit ({max_rows})", buffer
+        if size >= max_bytes:
+            return lines, f"size limit ({max_bytes} bytes)", buffer
+        if time.perf_counter() > deadline:
+            return lines, f"time limit ({max_seconds}s)", buffer
+        line = _format_result_line(buffer.popleft())
+        lines.append(line)
+        size += len(line) + 1
+
+def _format_result_page(columns: List[str], lines: List[str], first_row: int, reason: Optional[str], handle: Optional[str]) -> str:
+    """Assemble a (possibly truncated) page of formatted rows."""
+    header = f"Query Results ({len(lines)} rows"
+    if first_row:
+        header += f", starting at row {first_row + 1}"
+    header += ", truncated):" if reason else "):"
+    parts = [header, " | ".join(f"{col:<15}" for col in columns), "-" * (len(columns) * 17)]
+    parts.extend(lines)
+    if reason:
+        parts.append(f"... Result truncated at {reason}. Continuation handle: {handle}")
+        parts.append("Call fetch_more_results with this handle for the next rows.")
+    return "\n".join(parts) + "\n"
+
+def _run_query_internal(db_name: str, sql: str, params: Optional[list | dict] = None,
+                        max_rows: Optional[int] = None, max_bytes: Optional[int] = None,
+                        max_seconds: Optional[float] = None, analytic: bool = False,
+                        max_staleness: Optional[float] = None, deadline: Optional[float] = None) -> str:
+    """Internal helper to run any SQL query, optionally with bound parameters.
+
+    SELECT results are capped by the per-call limits and Config.MAX_RESULT_*;
+    deadline (seconds) is enforced as the ODBC query timeout.
+    Statements that cannot write run on the read-only connection profile;
+    analytic ones run against a snapshot of the database file.
+    """
+    path = get_db_path(db_name)
+    read_only = _is_read_only_sql(sql)
+    note = ""
+    if analytic:
+        if not read_only:
+            return "Error: analytic queries must be read-only SELECT statements"
+        try:
+            snapshot = _get_snapshot(path, max_staleness)
+        except Exception as e:
+            return f"Error: {str(e)}"
+        path = snapshot.path
+        note = f"(snapshot taken {snapshot.age:.0f}s ago)\n"
+
+    expired: List[_OpenResult] = []
+
+    def operation(pooled):
+        bound_sql, values = _bind_query_params(sql, params)
+        cursor = pooled.cursor_for(bound_sql)
+        cursor.execute(bound_sql, values)
+
+        # Anything that produced a result set (SELECT, TRANSFORM crosstabs) returns rows
+        if cursor.description is not None:
+            columns = [col[0] for col in cursor.description]
+            lines, reason, leftover = _fetch_result_page(cursor, (), *_result_limits(max_rows, max_bytes, max_seconds))
+            if not lines and not reason:
+                return "No results found"
+            handle = None
+            if reason:
+                # Park the cursor so the next execute of this SQL gets a fresh one
+                pooled.detach(bound_sql)
+                handle = uuid.uuid4().hex[:12]
+                with _pool_lock:
+                    _open_results[handle] = _OpenResult(pooled, cursor, columns, leftover, len(lines))
+                    expired.extend(_expire_open_results())
+            return _format_result_page(columns, lines, 0, reason, handle)
+        else:
+            pooled.conn.commit()
+            return "Query executed successfully"
+
+    try:
+        return note + _with_pooled_connection(path, operation, read_only=read_only, deadline=deadline)
     except Exception as e:
         return f"Error: {str(e)}"
+    finally:
+        # Expired results may live on other connections; cancel them once this one is released
+        _cancel_open_results(expired)
+
+def _get_table_schemas(db_name: str, table_names: List[str],
+                       errors: Optional[Dict[str, str]] = None) -> Dict[str, List[str]]:
+    """Get column names for many tables or queries over one pooled connection.
+
+    Args:
+        db_name: Database name or path
+        table_names: Tables or saved queries to describe
+        errors: If given, a source that cannot be described is recorded here
+            (name -> message) and left out of the result instead of raising
+
+    Raises:
+        ValueError: If a record source cannot be described and errors is None
+    """
+    path = get_db_path(db_name)
+
+    def operation(pooled):
+        cursor = pooled.conn.cursor()
+        schemas = {}
+        try:
+            for table_name in table_names:
+                try:
+                    cursor.execute(f"SELECT * FROM [{table_name}] WHERE 1=0")
+                except Exception as e:
+                    message = f"Could not retrieve schema for table or query '{table_name}'. Error: {e}"
+                    if errors is None:
+                        raise ValueError(message)
+                    errors[table_name] = message
+                    continue
+                schemas[table_name] = [col[0] for col in cursor.description]
+        finally:
+            cursor.close()
+        return schemas
+
+    return _with_pooled_connection(path, operation, read_only=True)
+
+def _list_user_tables(db_name: str) -> List[str]:
+    """Names of all non-system tables in the database."""
+    path = get_db_path(db_name)
+
+    def operation(pooled):
+        cursor = pooled.conn.cursor()
+        try:
+            return [row.table_name for row in cursor.tables(tableType='TABLE')
+                    if not row.table_name.startswith('MSys')]
+        finally:
+            cursor.close()
+
+    return _with_pooled_connection(path, operation, read_only=True)
 
 def _get_table_schema(db_name: str, table_name: str) -> list[str]:
     """Internal helper to get column names for a table or query."""
     path = get_db_path(db_name)
-    driver = get_driver()
-    conn_str = f"DRIVER={{{driver}}};DBQ={path};"
-    try:
-        with pyodbc.connect(conn_str) as conn:
-            cursor = conn.cursor()
+
+    def operation(pooled):
+        cursor = pooled.conn.cursor()
+        try:
             # Try to get schema by running a SELECT query, which works for both tables and queries
             cursor.execute(f"SELECT * FROM [{table_name}] WHERE 1=0")
-            columns = [col[0] for col in cursor.description]
-            if not columns:
-                raise ValueError(f"Table or query '{table_name}' not found or has no columns.")
-            return columns
+            return [col[0] for col in cursor.description]
+        finally:
+            cursor.close()
+
+    try:
+        columns = _with_pooled_connection(path, operation, read_only=True)
+        if not columns:
+            raise ValueError(f"Table or query '{table_name}' not found or has no columns.")
+        return columns
     except Exception as e:
         raise ValueError(f"Could not retrieve schema for table or query '{table_name}'. Error: {e}")
 def sanitize_vba_code(code: str) -> str:
@@ -393,8 +1705,452 @@ def sanitize_access_schema(schema: str) -> str:
     
     return schema.strip()
 
+# --- VBA Component Index ---
+# Every VBComponent property read is a cross-process COM call, so module
+# lookups go through a per-session index instead of scanning VBComponents.
+# Single lookups use VBComponents(name), which resolves the name inside Access
+# in one call; the full name -> (component, type, line count) table is built
+# only when something needs to enumerate, and is kept current on writes.
+
+_VBA_MODULE_TYPES = {
+    1: "Standard Module",
+    2: "Class Module",
+    3: "Form Module",
+    100: "Document Module"
+}
+
+class _VBAComponentIndex:
+    """Name -> VBComponent lookup for the VBA project of one Access session."""
+
+    def __init__(self, access):
+        self.access = access
+        self.project = access.VBE.VBProjects(1)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            components = self.project.VBComponents
+            for i in range(1, components.Count + 1):
+                component = components(i)
+                name = component.Name
+                self._entries[name.lower()] = {
+                    "name": name,
+                    "component": component,
+                    "type": component.Type,
+                    "lines": component.CodeModule.CountOfLines,
+                }
+        return self._entries
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """All components as dicts with name, component, type and lines."""
+        return list(self._load().values())
+
+    def get(self, name: str):
+        """Return the component called name (case-insensitive), or None."""
+        if self._entries is not None:
+            entry = self._entries.get(name.lower())
+            return entry["component"] if entry else None
+        try:
+            return self.project.VBComponents(name)
+        except Exception:
+            return None
+
+    def add(self, module_name: str, component_type: int = 1):
+        """Create a component (standard module by default) and index it."""
+        component = self.project.VBComponents.Add(component_type)
+        component.Name = module_name
+        if self._entries is not None:
+            self._entries[module_name.lower()] = {
+                "name": module_name, "component": component, "type": component_type, "lines": 0,
+            }
+        return component
+
+    def remove(self, name: str) -> bool:
+        component = self.get(name)
+        if component is None:
+            return False
+        self.project.VBComponents.Remove(component)
+        if self._entries is not None:
+            self._entries.pop(name.lower(), None)
+        return True
+
+    def set_line_count(self, name: str, lines: int) -> None:
+        if self._entries is not None and name.lower() in self._entries:
+            self._entries[name.lower()]["lines"] = lines
+
+_session_vba_index: Optional[_VBAComponentIndex] = None
+
+def _invalidate_vba_index(access) -> None:
+    """Drop the batch session's VBA index after objects were deleted or loaded behind its back."""
+    global _session_vba_index
+    if _session_vba_index is not None and _session_vba_index.access is access:
+        _session_vba_index = None
+
+def _get_vba_index(access) -> _VBAComponentIndex:
+    """VBA index for this Access session; batch sessions keep theirs across tool calls."""
+    global _session_vba_index
+    if access is not _batch_mode_access:
+        return _VBAComponentIndex(access)
+    if _session_vba_index is None or _session_vba_index.access is not access:
+        _session_vba_index = _VBAComponentIndex(access)
+    return _session_vba_index
+
+def _apply_vba_diff(code_module, current_lines: List[str], new_lines: List[str]) -> int:
+    """Turn current_lines into new_lines with ReplaceLine/InsertLines/DeleteLines.
+
+    Edits are applied bottom-up so earlier line numbers stay valid.
+
+    Returns:
+        Number of lines touched
+    """
+    touched = 0
+    opcodes = difflib.SequenceMatcher(None, current_lines, new_lines, autojunk=False).get_opcodes()
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == "equal":
+            continue
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            for offset in range(i2 - i1):
+                code_module.ReplaceLine(i1 + 1 + offset, new_lines[j1 + offset])
+        else:
+            if i2 > i1:
+                code_module.DeleteLines(i1 + 1, i2 - i1)
+            if j2 > j1:
+                code_module.InsertLines(i1 + 1, "\r\n".join(new_lines[j1:j2]))
+        touched += max(i2 - i1, j2 - j1)
+    return touched
+
+def _write_vba_code(index: _VBAComponentIndex, module_name: str, cleaned_code: str, incremental: bool = True) -> str:
+    """Write a module's code, creating a standard module if needed.
+
+    With incremental=True an existing module is diffed against the new code
+    and only the changed line ranges are rewritten; identical code is left
+    untouched. If applying the diff fails, the whole module is replaced.
+
+    Returns:
+        'created', 'updated' or 'unchanged'
+    """
+    # Look the module up by name instead of scanning the project
+    component = index.get(module_name)
+    
+    if component is None:
+        # Create new standard module
+        code_module = index.add(module_name, 1).CodeModule  # 1 = vbext_ct_StdModule
+        code_module.AddFromString(cleaned_code)
+        index.set_line_count(module_name, code_module.CountOfLines)
+        logger.info(f"Created new module: {module_name}")
+        return "created"
+
+    code_module = component.CodeModule
+    line_count = code_module.CountOfLines
+    if incremental:
+        current_lines = code_module.Lines(1, line_count).splitlines() if line_count > 0 else []
+        new_lines = cleaned_code.splitlines()
+        # Trailing blank lines are not significant to VBA
+        while current_lines and not current_lines[-1].strip():
+            current_lines.pop()
+        while new_lines and not new_lines[-1].strip():
+            new_lines.pop()
+        # sanitize_vba_code strips Option Compare Database because Access adds it;
+        # keep the module's own copy so the diff never drops it (and with it the
+        # module's text comparison mode)
+        for position, line in enumerate(current_lines):
+            if line.strip().lower() == "option compare database":
+                if not any(new.strip().lower() == "option compare database" for new in new_lines):
+                    new_lines.insert(min(position, len(new_lines)), line)
+                break
+        if current_lines == new_lines:
+            logger.info(f"Module unchanged, skipped write: {module_name}")
+            return "unchanged"
+        try:
+            touched = _apply_vba_diff(code_module, current_lines, new_lines)
+            index.set_line_count(module_name, code_module.CountOfLines)
+            logger.info(f"Updated existing module: {module_name} ({touched} lines changed)")
+            return "updated"
+        except Exception as e:
+            logger.warning(f"Incremental update of {module_name} failed, replacing whole module: {e}")
+            line_count = code_module.CountOfLines
+
+    # Clear existing code
+    if line_count > 0:
+        code_module.DeleteLines(1, line_count)
+    # Add new code (cleaned)
+    code_module.AddFromString(cleaned_code)
+    index.set_line_count(module_name, code_module.CountOfLines)
+    logger.info(f"Updated existing module: {module_name}")
+    return "updated"
+
+def _save_vba_module(access, module_name: str) -> None:
+    """Save a VBA module explicitly, falling back to saving the database."""
+    try:
+        # Method 1: Try to save the component
+        access.DoCmd.Save(5, module_name)  # 5 = acModule
+        logger.debug(f"Saved VBA module using DoCmd.Save")
+    except Exception as e1:
+        logger.debug(f"DoCmd.Save failed: {e1}, trying alternative")
+        try:
+            # Method 2: Save the database (forces VBA save)
+            access.DoCmd.Save()
+            logger.debug(f"Saved database (includes VBA)")
+        except Exception as e2:
+            logger.debug(f"DoCmd.Save() failed: {e2}, VBA may not be saved")
+
+def _compile_vba_project(access) -> Tuple[bool, str]:
+    """Compile and save all modules.
+
+    Returns:
+        Tuple of (compiled: bool, error_message: str)
+    """
+    try:
+        # This will throw an error if there are compilation errors
+        access.DoCmd.RunCommand(AC_CMD_COMPILE_AND_SAVE_ALL_MODULES)
+        logger.debug("VBA compiled successfully")
+        return True, ""
+    except Exception as e:
+        message = _format_diagnostic(_compile_diagnostics(access, e)[0])
+        logger.warning(f"Could not compile VBA (may have errors): {message}")
+        return False, message
+
+def _compile_diagnostics(access, error: Exception) -> List[Dict[str, Any]]:
+    """Turn a failed compile into diagnostics using the VBE's error location.
+
+    The VBA compiler stops at the first error and leaves the active code pane
+    selecting it, so this yields at most one entry.
+    """
+    excepinfo = getattr(error, "excepinfo", None)
+    message = excepinfo[2] if excepinfo and excepinfo[2] else str(error)
+    diagnostic = {"module": None, "line": None, "column": None, "message": message}
+    try:
+        pane = access.VBE.ActiveCodePane
+        if pane is not None:
+            diagnostic["module"] = pane.CodeModule.Parent.Name
+            # pywin32 returns the out-parameters as (start_line, start_col, end_line, end_col)
+            selection = pane.GetSelection()
+            diagnostic["line"], diagnostic["column"] = selection[0], selection[1]
+    except Exception as e:
+        logger.debug(f"Could not read compile error location: {e}")
+    return [diagnostic]
+
+def _format_diagnostic(diagnostic: Dict[str, Any]) -> str:
+    location = diagnostic["module"] or "unknown module"
+    if diagnostic["line"]:
+        location += f" line {diagnostic['line']}"
+        if diagnostic["column"]:
+            location += f", col {diagnostic['column']}"
+    return f"{location}: {diagnostic['message']}"
+
+# Last compile outcome per database, with the SHA-256 of every module it covered
+# and the database file's (mtime, size) after the checking session closed it
+_vba_compile_cache: Dict[str, Dict[str, Any]] = {}
+
+def _database_fingerprint(path: str) -> Tuple[int, int]:
+    """Modification time and size of a database file, to detect any change without opening it."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def _vba_module_hashes(index: _VBAComponentIndex) -> Dict[str, str]:
+    """SHA-256 of each module's current code, keyed by module name."""
+    hashes = {}
+    for entry in index.entries():
+        code_module = entry["component"].CodeModule
+        line_count = code_module.CountOfLines
+        code = code_module.Lines(1, line_count) if line_count > 0 else ""
+        hashes[entry["name"]] = hashlib.sha256(code.encode("utf-8")).hexdigest()
+    return hashes
+
+# --- Offline VBA Index ---
+# A small pure-Python VBA scanner over exported module text (see
+# export_database_objects), so "where is X defined / who calls X" can be
+# answered without launching Access. Results are cached per file content hash.
+
+_VBA_PROCEDURE_START = re.compile(
+    r'^(?:(Public|Private|Friend|Global)\s+)?(?:Static\s+)?(Sub|Function|Property\s+(?:Get|Let|Set))\s+(\w+)',
+    re.IGNORECASE)
+_VBA_PROCEDURE_END = re.compile(r'^End\s+(Sub|Function|Property)\b', re.IGNORECASE)
+_VBA_DECLARE = re.compile(r'^(?:(Public|Private|Global)\s+)?Declare\s+(?:PtrSafe\s+)?(Sub|Function)\s+(\w+)', re.IGNORECASE)
+_VBA_TYPE_OR_ENUM = re.compile(r'^(?:(Public|Private)\s+)?(Type|Enum)\s+(\w+)', re.IGNORECASE)
+_VBA_VARIABLE = re.compile(r'^(Public|Private|Global|Dim|Const)\s+(?:(?:WithEvents|Const)\s+)?(\w+)', re.IGNORECASE)
+_VBA_STRING = re.compile(r'"(?:[^"]|"")*"')
+_VBA_IDENTIFIER = re.compile(r'\b[A-Za-z_]\w*\b')
+_VBA_NAME_ATTRIBUTE = re.compile(r'^Attribute\s+VB_Name\s*=\s*"([^"]+)"', re.IGNORECASE)
+
+class _VBAModuleIndex:
+    """Procedures, declarations and identifier references of one VBA module."""
+
+    def __init__(self, module_name: str):
+        self.module_name = module_name
+        self.procedures: List[Dict[str, Any]] = []  # {name, kind, scope, line, end_line}
+        self.declarations: List[Dict[str, Any]] = []  # {name, kind, scope, line}
+        self.references: Dict[str, List[Tuple[Optional[str], int]]] = {}  # identifier -> [(procedure, line)]
+
+def _vba_logical_lines(code: str):
+    """Yield (line_number, text) with comments and string contents removed and
+    ' _' continuations joined onto the line they start on."""
+    pending, pending_line = "", 0
+    for line_no, raw in enumerate(code.splitlines(), 1):
+        line = _VBA_STRING.sub('""', raw)
+        quote = line.find("'")
+        if quote >= 0:
+            line = line[:quote]
+        if re.match(r'^\s*Rem\b', line, re.IGNORECASE):
+            line = ""
+        if not pending:
+            pending_line = line_no
+        if line.rstrip().endswith(" _"):
+            pending += line.rstrip()[:-1] + " "
+            continue
+        yield pending_line, (pending + line).strip()
+        pending = ""
+    if pending:
+        yield pending_line, pending.strip()
+
+def _index_vba_module(module_name: str, code: str) -> _VBAModuleIndex:
+    """Scan one module's code into a _VBAModuleIndex."""
+    index = _VBAModuleIndex(module_name)
+    current = None
+    for line_no, line in _vba_logical_lines(code):
+        if not line or line.lower().startswith("attribute "):
+            continue
+        if current is None:
+            match = _VBA_PROCEDURE_START.match(line)
+            if match:
+                current = {"name": match.group(3), "kind": " ".join(match.group(2).split()).title(),
+                           "scope": (match.group(1) or "Public").title(), "line": line_no, "end_line": None}
+                index.procedures.append(current)
+                # Parameters and return types on the signature count as references
+                line = line[match.end():]
+            else:
+                for pattern, kind_group in ((_VBA_DECLARE, 2), (_VBA_TYPE_OR_ENUM, 2), (_VBA_VARIABLE, None)):
+                    match = pattern.match(line)
+                    if match:
+                        kind = match.group(kind_group).title() if kind_group else (
+                            "Const" if re.search(r'\bConst\b', line, re.IGNORECASE) else "Variable")
+                        scope = (match.group(1) or "Private").title()
+                        if scope == "Dim":
+                            scope = "Private"
+                        name = match.group(3) if pattern is not _VBA_VARIABLE else match.group(2)
+                        index.declarations.append({"name": name, "kind": kind, "scope": scope, "line": line_no})
+                        break
+                continue
+        elif _VBA_PROCEDURE_END.match(line):
+            current["end_line"] = line_no
+            current = None
+            continue
+        for identifier in _VBA_IDENTIFIER.findall(line):
+            index.references.setdefault(identifier.lower(), []).append((current["name"] if current else None, line_no))
+    return index
+
+# (sha256, module name) -> index, or None for a form/report without code-behind
+_vba_index_cache: "OrderedDict[Tuple[str, str], Optional[_VBAModuleIndex]]" = OrderedDict()
+
+def _strip_vba_header(text: str) -> str:
+    """Drop the leading Attribute lines SaveAsText writes before a module's code,
+    so line numbers match the VBA editor."""
+    lines = text.splitlines(keepends=True)
+    start = 0
+    while start < len(lines) and lines[start].lstrip().lower().startswith("attribute "):
+        start += 1
+    return "".join(lines[start:])
+
+def _load_vba_sources(source_dir: str) -> List[_VBAModuleIndex]:
+    """Index every module in an export directory (modules plus form/report code-behind)."""
+    indexes = []
+    for sub_dir, extension, marker in (("modules", ".bas", None), ("forms", ".txt", "CodeBehindForm"),
+                                       ("reports", ".txt", "CodeBehindReport")):
+        type_dir = os.path.join(source_dir, sub_dir)
+        if not os.path.isdir(type_dir):
+            continue
+        for file_name in sorted(os.listdir(type_dir)):
+            if not file_name.endswith(extension):
+                continue
+            with open(os.path.join(type_dir, file_name), "rb") as f:
+                raw = f.read()
+            module_name = file_name[:-len(extension)]
+            if marker:
+                module_name = f"{'Form' if sub_dir == 'forms' else 'Report'}_{module_name}"
+            key = (hashlib.sha256(raw).hexdigest(), module_name)
+            if key in _vba_index_cache:
+                _vba_index_cache.move_to_end(key)
+                cached = _vba_index_cache[key]
+            else:
+                # SaveAsText writes forms/reports as UTF-16 and modules in the ANSI code page
+                encoding = "utf-16" if raw[:2] in (b"\xff\xfe", b"\xfe\xff") else "cp1252"
+                text = raw.decode(encoding, errors="replace")
+                cached = None
+                if not marker or marker in text:
+                    if marker:
+                        # Code-behind starts on the line after the marker
+                        text = text.split(marker, 1)[1].partition("\n")[2]
+                    name_match = _VBA_NAME_ATTRIBUTE.search(text[:2000]) if not marker else None
+                    cached = _index_vba_module(name_match.group(1) if name_match else module_name,
+                                               _strip_vba_header(text))
+                _vba_index_cache[key] = cached
+                if len(_vba_index_cache) > Config.VBA_INDEX_CACHE_SIZE:
+                    _vba_index_cache.popitem(last=False)
+            if cached is not None:
+                indexes.append(cached)
+    return indexes
+
+@mcp.tool
+def search_vba_code(source_dir: str, symbol: str, mode: str = "definition") -> str:
+    """Search exported VBA source without opening Access.
+
+    Works on a directory written by export_database_objects (modules/*.bas and
+    the code-behind of forms/*.txt and reports/*.txt). Line numbers count from
+    the first line after the Attribute header, as in the VBA editor. Parsed
+    modules are kept in a bounded cache keyed by content hash and module name,
+    so repeated searches only re-parse changed files.
+
+    Args:
+        source_dir: Export directory
+        symbol: Procedure/variable name, or a module name (or '*') for mode='procedures'
+        mode: 'definition' (where symbol is declared), 'callers' (procedures that
+              reference symbol) or 'procedures' (list procedures in a module)
+    """
+    mode = mode.lower()
+    if mode not in ("definition", "callers", "procedures"):
+        return "Error: mode must be 'definition', 'callers' or 'procedures'"
+    if not os.path.isdir(source_dir):
+        return f"Error: Source directory not found: {source_dir}"
+
+    modules = _load_vba_sources(source_dir)
+    key = symbol.lower()
+    lines = []
+    if mode == "procedures":
+        for module in modules:
+            if symbol != "*" and module.module_name.lower() != key:
+                continue
+            for proc in module.procedures:
+                lines.append(f"- {module.module_name}.{proc['name']} ({proc['scope']} {proc['kind']}, "
+                             f"lines {proc['line']}-{proc['end_line'] or '?'})")
+        return "\n".join(lines) if lines else f"No procedures found for '{symbol}'"
+
+    if mode == "definition":
+        for module in modules:
+            for proc in module.procedures:
+                if proc["name"].lower() == key:
+                    lines.append(f"- {module.module_name} line {proc['line']}: {proc['scope']} {proc['kind']} {proc['name']}")
+            for decl in module.declarations:
+                if decl["name"].lower() == key:
+                    lines.append(f"- {module.module_name} line {decl['line']}: {decl['scope']} {decl['kind']} {decl['name']}")
+        return "\n".join(lines) if lines else f"No definition of '{symbol}' found in {len(modules)} modules"
+
+    for module in modules:
+        callers: Dict[Optional[str], List[int]] = {}
+        for procedure, line_no in module.references.get(key, []):
+            # A function assigning its own return value is not a call
+            if procedure and procedure.lower() == key:
+                continue
+            callers.setdefault(procedure, []).append(line_no)
+        for procedure, line_numbers in callers.items():
+            where = f"{module.module_name}.{procedure}" if procedure else f"{module.module_name} (module level)"
+            lines.append(f"- {where}: line(s) {', '.join(map(str, line_numbers))}")
+    return "\n".join(lines) if lines else f"No references to '{symbol}' found in {len(modules)} modules"
+
 def check_vba_compilation_errors(access_app) -> Tuple[bool, str]:
     """Check if there are VBA compilation errors in the current database
+
+    Compiles without saving, so the check leaves the modules as they are.
     
     Args:
         access_app: Active Access.Application COM object
@@ -403,30 +2159,13 @@ def check_vba_compilation_errors(access_app) -> Tuple[bool, str]:
         Tuple of (has_errors: bool, error_message: str)
     """
     try:
-        # Try to access the VBA project
-        project = access_app.VBE.VBProjects(1)
-        
-        # Try to compile the project
-        # Note: This doesn't actually compile, but accessing modules can reveal errors
-        for i in range(1, project.VBComponents.Count + 1):
-            try:
-                component = project.VBComponents(i)
-                # Try to access the code module
-                if component.CodeModule.CountOfLines > 0:
-                    # Just accessing it can trigger compilation
-                    _ = component.CodeModule.Lines(1, 1)
-            except Exception as comp_ex:
-                error_msg = str(comp_ex)
-                if "compile" in error_msg.lower() or "syntax" in error_msg.lower():
-                    logger.warning(f"VBA compilation error detected in {component.Name}: {error_msg}")
-                    return True, f"VBA compilation error in {component.Name}: {error_msg}"
-        
+        access_app.DoCmd.RunCommand(AC_CMD_COMPILE_ALL_MODULES)
         return False, "No VBA compilation errors detected"
-        
     except Exception as e:
-        # If we can't check, assume no errors (or VBA is protected)
-        logger.info(f"Could not check VBA compilation (may be protected): {e}")
-        return False, "VBA check skipped (protected or no VBA)"
+        diagnostics = _compile_diagnostics(access_app, e)
+        logger.warning(f"VBA compilation error detected: {_format_diagnostic(diagnostics[0])}")
+        return True, f"VBA compilation error in {_format_diagnostic(diagnostics[0])}"
+
 @mcp.tool()
 def save_and_close_access_database(db_name: str, force_close: bool = False) -> dict:
     """
@@ -505,7 +2244,7 @@ def save_and_close_access_database(db_name: str, force_close: bool = False) -> d
         # Wait a moment for Access to close
         time.sleep(0.5)
         
-        lock_file = current_path.replace('.accdb', '.laccdb')
+        lock_file = _lock_file_path(current_path)
         lock_released = not os.path.exists(lock_file)
 
         return {
@@ -583,13 +2322,41 @@ def force_close_access(db_name: str = None) -> dict:
         logger.error(f"Unexpected error in force_close: {e}")
         return {"success": False, "message": f"Unexpected error: {str(e)}"}
 
+@mcp.tool
+def inspect_database_lock(db_name: str, clear_stale: bool = False) -> dict:
+    """
+    Report who holds a database's lock file and whether the lock is stale.
+
+    Slots list every machine/user that opened the database since the lock file
+    was created; a lock is stale when no process still has the file open.
+    
+    Args:
+        db_name: Database name
+        clear_stale: Delete the lock file if it is stale
+    
+    Returns:
+        dict with lock_file, exists, stale, holders and cleared
+    """
+    is_valid, error_msg = _validate_database_name(db_name)
+    if not is_valid:
+        return {"success": False, "message": error_msg}
+
+    try:
+        info = _inspect_lock(get_db_path(db_name))
+        info["success"] = True
+        info["cleared"] = _clear_stale_lock(info) if clear_stale else False
+        return info
+    except Exception as e:
+        logger.error(f"Error inspecting lock: {e}")
+        return {"success": False, "message": f"Error inspecting lock: {str(e)}"}
+
 @mcp.tool
 def create_database(db_name: str) -> str:
     """Create an empty Access .accdb database"""
     path = get_db_path(db_name)
     if os.path.exists(path):
         os.remove(path)
-    adox = Dispatch("ADOX.Catalog")
+    adox = win32com.client.Dispatch("ADOX.Catalog")
     conn_str = f"Provider=Microsoft.ACE.OLEDB.12.0;Data Source={path};"
     adox.Create(conn_str)
     return f"Database created at: {path}"
@@ -642,9 +2409,112 @@ def insert_data(db_name: str, table: str, rows: list[dict]) -> str:
         return f"Inserted {len(rows)} rows into '{table}'"
 
 @mcp.tool
-def run_query(db_name: str, sql: str) -> str:
-    """Run a SELECT or action query (INSERT, UPDATE, DELETE)."""
-    return _run_query_internal(db_name, sql)
+def run_query(db_name: str, sql: str, params: Optional[list | dict] = None,
+              max_rows: Optional[int] = None, max_bytes: Optional[int] = None,
+              max_seconds: Optional[float] = None, analytic: bool = False,
+              max_staleness: Optional[float] = None, timeout_seconds: Optional[float] = None) -> str:
+    """Run a SELECT or action query (INSERT, UPDATE, DELETE).
+
+    Values should be bound rather than interpolated into the SQL text:
+    use '?' markers with a list (params=[5, 'Ali']) or ':name' markers with a
+    dict (params={'id': 5}). Repeated statement shapes reuse a prepared statement.
+
+    SELECT results stop at max_rows / max_bytes / max_seconds (each capped by the
+    server-wide limit). A truncated result ends with a continuation handle for
+    fetch_more_results.
+
+    analytic=True runs a SELECT against a read-replica copy of the database so
+    heavy reporting queries do not contend with writers. The copy is refreshed
+    when the database has changed and the copy is older than max_staleness
+    seconds (default: server setting); max_staleness=0 forces fresh data.
+
+    timeout_seconds overrides the server's deadline for this call; a statement
+    still running at the deadline is cancelled.
+    """
+    limit_error = _check_result_limits(max_rows, max_bytes, max_seconds)
+    if limit_error:
+        return limit_error
+    return _run_query_internal(db_name, sql, params, max_rows, max_bytes, max_seconds,
+                               analytic, max_staleness, _call_deadline("run_query", timeout_seconds))
+
+@mcp.tool
+def fetch_more_results(handle: str, max_rows: Optional[int] = None, max_bytes: Optional[int] = None,
+                       max_seconds: Optional[float] = None) -> str:
+    """Fetch the next rows of a truncated run_query result.
+
+    Args:
+        handle: Continuation handle printed at the end of a truncated result
+        max_rows: Optional row limit for this page (capped by the server limit)
+        max_bytes: Optional size limit for this page (capped by the server limit)
+        max_seconds: Optional fetch time limit for this page (capped by the server limit)
+    """
+    limit_error = _check_result_limits(max_rows, max_bytes, max_seconds)
+    if limit_error:
+        return limit_error
+    with _pool_lock:
+        expired = _expire_open_results()
+        result = _open_results.pop(handle, None)
+    _cancel_open_results(expired)
+    if result is None:
+        return f"Error: Continuation handle '{handle}' is unknown or has expired"
+    with result.pooled.lock:
+        if result.pooled.closed:
+            return f"Error: Continuation handle '{handle}' is unknown or has expired"
+        try:
+            lines, reason, leftover = _fetch_result_page(
+                result.cursor, result.leftover, *_result_limits(max_rows, max_bytes, max_seconds))
+        except Exception as e:
+            result.cancel()
+            return f"Error: {str(e)}"
+        if not reason:
+            result.cancel()
+    first_row = result.returned
+    if reason:
+        result.leftover = leftover
+        result.returned += len(lines)
+        result.created = time.time()
+        with _pool_lock:
+            _open_results[handle] = result
+    if not lines and not reason:
+        return "No more rows"
+    return _format_result_page(result.columns, lines, first_row, reason, handle)
+
+@mcp.tool
+def execute_many(db_name: str, sql: str, param_sets: list[list | dict],
+                 timeout_seconds: Optional[float] = None) -> str:
+    """Run one parameterized action query for many parameter sets in a single transaction.
+
+    The statement is prepared once and executed for each entry in param_sets.
+    timeout_seconds overrides the server's deadline for the whole batch.
+    Example: sql="UPDATE Products SET Price = :price WHERE ID = :id",
+    param_sets=[{'price': 9.5, 'id': 1}, {'price': 12, 'id': 2}]
+    """
+    if not param_sets:
+        return "Error: param_sets cannot be empty"
+    if sql.strip().lower().startswith("select"):
+        return "Error: execute_many is for action queries; use run_query for SELECT"
+
+    path = get_db_path(db_name)
+
+    def operation(pooled):
+        affected = 0
+        for index, params in enumerate(param_sets):
+            bound_sql, values = _bind_query_params(sql, params)
+            cursor = pooled.cursor_for(bound_sql)
+            try:
+                cursor.execute(bound_sql, values)
+            except Exception as e:
+                pooled.conn.rollback()
+                raise Exception(f"parameter set {index} failed, transaction rolled back: {e}")
+            if cursor.rowcount and cursor.rowcount > 0:
+                affected += cursor.rowcount
+        pooled.conn.commit()
+        return f"Executed {len(param_sets)} statements ({affected} rows affected)"
+
+    try:
+        return _with_pooled_connection(path, operation, deadline=_call_deadline("execute_many", timeout_seconds))
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 @mcp.tool
 def find_database(db_name: str) -> str:
@@ -696,10 +2566,9 @@ def find_database(db_name: str) -> str:
 def list_tables(db_name: str) -> str:
     """List all tables in the database"""
     path = get_db_path(db_name)
-    driver = get_driver()
-    conn_str = f"DRIVER={{{driver}}};DBQ={path};"
+    conn_str = _connection_string(path, read_only=True)
     try:
-        with pyodbc.connect(conn_str) as conn:
+        with pyodbc.connect(conn_str, readonly=True) as conn:
             cursor = conn.cursor()
             tables = cursor.tables(tableType='TABLE')
             table_names = [row.table_name for row in tables if not row.table_name.startswith('MSys')]
@@ -709,6 +2578,268 @@ def list_tables(db_name: str) -> str:
                 return "No tables found"
     except Exception as e:
         return f"Error: {str(e)}"
+def _get_primary_key_columns(cursor, table_name: str) -> List[str]:
+    """Detect the primary key columns of a table through the ODBC catalog.
+
+    The Access driver does not always implement SQLPrimaryKeys, so this falls
+    back to SQLStatistics and looks for the 'PrimaryKey' index, then for any
+    unique index.
+
+    Returns:
+        Key column names in key order (empty if the table has no unique key)
+    """
+    try:
+        keys = sorted(cursor.primaryKeys(table=table_name), key=lambda r: r.key_seq)
+        if keys:
+            return [row.column_name for row in keys]
+    except Exception as e:
+        logger.debug(f"primaryKeys() not supported for '{table_name}': {e}")
+
+    indexes: Dict[str, List[Tuple[int, str]]] = {}
+    for row in cursor.statistics(table=table_name, unique=True):
+        if row.index_name and row.column_name:
+            indexes.setdefault(row.index_name, []).append((row.ordinal_position, row.column_name))
+    if not indexes:
+        return []
+    index_name = "PrimaryKey" if "PrimaryKey" in indexes else sorted(indexes)[0]
+    return [name for _, name in sorted(indexes[index_name])]
+
+def _encode_page_token(table_name: str, key_columns: List[str], key_values: List[Any]) -> str:
+    """Build an opaque continuation token holding the last key seen on a page.
+
+    Raises:
+        ValueError: If a key value has a type the token cannot round-trip
+    """
+    values = []
+    for column, value in zip(key_columns, key_values):
+        if isinstance(value, datetime.datetime):
+            values.append(["dt", value.isoformat()])
+        elif isinstance(value, datetime.date):
+            values.append(["d", value.isoformat()])
+        elif isinstance(value, decimal.Decimal):
+            # Currency/Decimal keys must bind as Decimal again, not as text or float
+            values.append(["dec", str(value)])
+        elif isinstance(value, (int, float, str)) or value is None:
+            values.append(["v", value])
+        else:
+            raise ValueError(f"Cannot page on key column '{column}': "
+                             f"values of type {type(value).__name__} are not supported")
+    payload = json.dumps({"t": table_name, "k": key_columns, "v": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+def _decode_page_token(token: str, table_name: str) -> Tuple[List[str], List[Any]]:
+    """Decode a continuation token produced by _encode_page_token.
+
+    Raises:
+        ValueError: If the token is malformed or belongs to another table
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8"))
+    except Exception:
+        raise ValueError("Invalid continuation token")
+    if payload.get("t", "").lower() != table_name.lower():
+        raise ValueError(f"Continuation token was issued for table '{payload.get('t')}', not '{table_name}'")
+    values = []
+    for kind, value in payload["v"]:
+        if kind == "dt":
+            values.append(datetime.datetime.fromisoformat(value))
+        elif kind == "d":
+            values.append(datetime.date.fromisoformat(value))
+        elif kind == "dec":
+            values.append(decimal.Decimal(value))
+        elif kind == "v":
+            values.append(value)
+        else:
+            raise ValueError("Invalid continuation token")
+    return payload["k"], values
+
+def _keyset_predicate(key_columns: List[str]) -> str:
+    """Build a '(a > ?) OR (a = ? AND b > ?)' predicate for a composite key."""
+    terms = []
+    for i, column in enumerate(key_columns):
+        parts = [f"[{c}] = ?" for c in key_columns[:i]] + [f"[{column}] > ?"]
+        terms.append("(" + " AND ".join(parts) + ")")
+    return " OR ".join(terms)
+
+@mcp.tool
+def browse_table(db_name: str, table_name: str, page_size: int = 100, continuation_token: str = "") -> str:
+    """Page through a large table using keyset pagination on its primary key.
+
+    Access SQL has no OFFSET, so each page is fetched with
+    'SELECT TOP n ... WHERE pk > last ORDER BY pk', which costs the same on page
+    1000 as on page 1.
+
+    Args:
+        db_name: Database name or path
+        table_name: Table to browse (must have a primary key or unique index)
+        page_size: Rows per page (1-1000, default 100)
+        continuation_token: Token returned by the previous page; empty for the first page
+
+    Returns:
+        The page rows followed by the continuation token for the next page, if any
+    """
+    if not 1 <= page_size <= 1000:
+        return "Error: page_size must be between 1 and 1000"
+
+    path = get_db_path(db_name)
+    conn_str = _connection_string(path, read_only=True)
+
+    try:
+        with pyodbc.connect(conn_str, readonly=True) as conn:
+            cursor = conn.cursor()
+            if continuation_token:
+                key_columns, last_key = _decode_page_token(continuation_token, table_name)
+            else:
+                key_columns, last_key = _get_primary_key_columns(cursor, table_name), []
+                if not key_columns:
+                    return f"Error: Table '{table_name}' has no primary key or unique index to page on"
+
+            order_by = ", ".join(f"[{c}]" for c in key_columns)
+            sql = f"SELECT TOP {page_size} * FROM [{table_name}]"
+            params: List[Any] = []
+            if last_key:
+                sql += f" WHERE {_keyset_predicate(key_columns)}"
+                for i in range(len(key_columns)):
+                    params.extend(last_key[:i + 1])
+            sql += f" ORDER BY {order_by}"
+
+            cursor.execute(sql, params)
+            columns = [col[0] for col in cursor.description]
+            rows = cursor.fetchall()
+            if not rows:
+                return "No more rows"
+
+            result = _format_result_rows(columns, rows)
+            if len(rows) < page_size:
+                return result + "End of table reached."
+            lowered = [c.lower() for c in columns]
+            positions = [lowered.index(c.lower()) for c in key_columns]
+            token = _encode_page_token(table_name, key_columns, [rows[-1][p] for p in positions])
+            return result + f"Continuation token: {token}"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+# Table statistics keyed by (normalized db path, lower-case table name); each
+# entry remembers the database file mtime it was computed against.
+_table_stats_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+def _estimate_value_bytes(value: Any) -> int:
+    """Rough storage size of a fetched value, used for table size estimates."""
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float, datetime.date, datetime.datetime)):
+        return 8
+    if isinstance(value, str):
+        return len(value) * 2
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(str(value))
+
+def _collect_table_statistics(cursor, table_name: str) -> Dict[str, Any]:
+    """Compute row count, size and cardinality estimates without a full transfer.
+
+    The row count and index cardinalities come from SQLStatistics when the
+    driver provides them (falling back to COUNT(*)); per-row size and the
+    cardinality of non-indexed columns are estimated from a TOP-n sample.
+    """
+    row_count = None
+    index_cardinality: Dict[str, int] = {}
+    try:
+        for row in cursor.statistics(table=table_name, quick=True):
+            if row.type == 0 and row.cardinality is not None:  # SQL_TABLE_STAT
+                row_count = row.cardinality
+            elif row.column_name and row.cardinality is not None:
+                current = index_cardinality.get(row.column_name, 0)
+                index_cardinality[row.column_name] = max(current, row.cardinality)
+    except Exception as e:
+        logger.debug(f"statistics() not available for '{table_name}': {e}")
+
+    if row_count is None:
+        cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
+        row_count = cursor.fetchone()[0]
+
+    cursor.execute(f"SELECT TOP {Config.STATS_SAMPLE_ROWS} * FROM [{table_name}]")
+    columns = [col[0] for col in cursor.description]
+    sample = cursor.fetchall()
+
+    column_stats = []
+    total_bytes = 0
+    for i, column in enumerate(columns):
+        values = [row[i] for row in sample]
+        column_bytes = sum(_estimate_value_bytes(v) for v in values)
+        total_bytes += column_bytes
+        if column in index_cardinality:
+            cardinality, source = index_cardinality[column], "index"
+        else:
+            distinct = len(set(values))
+            # A sample with no repeats suggests a near-unique column
+            if sample and distinct == len(sample):
+                cardinality = row_count
+            else:
+                cardinality = distinct
+            source = "sample"
+        column_stats.append({
+            "name": column,
+            "cardinality": cardinality,
+            "cardinality_source": source,
+            "nulls_in_sample": sum(1 for v in values if v is None),
+            "avg_bytes": round(column_bytes / len(sample), 1) if sample else 0,
+        })
+
+    avg_row_bytes = total_bytes / len(sample) if sample else 0
+    return {
+        "row_count": row_count,
+        "sampled_rows": len(sample),
+        "avg_row_bytes": round(avg_row_bytes, 1),
+        "estimated_bytes": int(avg_row_bytes * row_count),
+        "columns": column_stats,
+    }
+
+@mcp.tool
+def get_table_statistics(db_name: str, table_name: str, refresh: bool = False) -> str:
+    """Report row count, approximate size and column cardinality for a table.
+
+    Use this instead of 'SELECT *' to find out how big a table is. Results are
+    cached until the database file changes (or refresh=True).
+
+    Args:
+        db_name: Database name or path
+        table_name: Table or saved query to measure
+        refresh: Ignore cached statistics and recompute
+    """
+    path = get_db_path(db_name)
+    if not os.path.exists(path):
+        return f"Error: Database not found at {path}"
+
+    cache_key = (os.path.normcase(path), table_name.lower())
+    mtime = os.path.getmtime(path)
+    cached = _table_stats_cache.get(cache_key)
+    if cached and cached[0] == mtime and not refresh:
+        stats, source = cached[1], "cached"
+    else:
+        try:
+            stats = _with_pooled_connection(path, lambda pooled: _collect_table_statistics(pooled.conn.cursor(), table_name),
+                                            read_only=True)
+        except Exception as e:
+            return f"Error: {str(e)}"
+        _table_stats_cache[cache_key] = (mtime, stats)
+        source = "computed"
+
+    lines = [
+        f"Statistics for '{table_name}' ({source}):",
+        f"Rows: {stats['row_count']}",
+        f"Estimated size: {stats['estimated_bytes']:,} bytes ({stats['avg_row_bytes']} bytes/row, {stats['sampled_rows']} rows sampled)",
+        "Columns:",
+    ]
+    for col in stats["columns"]:
+        lines.append(
+            f"- {col['name']}: ~{col['cardinality']} distinct ({col['cardinality_source']}), "
+            f"{col['avg_bytes']} bytes avg, {col['nulls_in_sample']} nulls in sample"
+        )
+    return "\n".join(lines)
+
 def fix_access_sql_syntax(sql: str) -> str:
     """
     Automatically fix common Access SQL syntax issues:
@@ -848,6 +2979,500 @@ def save_query(db_name: str, query_name: str, sql: str) -> str:
 
 
 
+# --- SaveAsText Template Engine ---
+# Forms and reports are built as a layout model (a tree of _LayoutNode blocks)
+# and serialized in one pass into a list of lines, instead of growing a string
+# with repeated f-string concatenation. The same builders are shared by the
+# template tools and the one-step report tool.
+
+_NAMEMAP_TERMINATOR = "0x000000000000000000000000000000000c000000050000000000000000000000000000000000"
+_INDENTS = [" " * (4 * depth) for depth in range(16)]
+
+def _format_property(value: Any) -> str:
+    """Render a SaveAsText property value: numbers bare, text quoted."""
+    if isinstance(value, (int, float)):
+        return str(value)
+    return f'"{value}"'
+
+def _namemap_entry(name: str, seed: Optional[str] = None) -> str:
+    """Build one NameMap entry (16-byte id, name length, UTF-16LE name).
+
+    The id is random unless a seed is given, in which case it is derived from
+    the seed so the same document always produces the same NameMap.
+    """
+    if seed is None:
+        rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
+    else:
+        rand_hex = hashlib.md5(seed.encode('utf-8')).hexdigest()
+    return f"0x{rand_hex}{len(name):02x}000000{name.encode('utf-16le').hex()}"
+
+class _LayoutNode:
+    """One 'Begin <kind> ... End' block of a form/report: a section or a control.
+
+    Controls get a GUID; sections do not. Children are emitted in a nested
+    'Begin ... End' group, which is how Access nests labels in text boxes and
+    controls in sections.
+    """
+
+    def __init__(self, kind: str, props: List[Tuple[str, Any]], children: Optional[List["_LayoutNode"]] = None):
+        self.kind = kind
+        self.props = props
+        self.children = children or []
+        self.guid = None if kind == "Section" else uuid.uuid4().hex
+
+    @property
+    def name(self) -> Optional[str]:
+        for key, value in self.props:
+            if key == "Name":
+                return value
+        return None
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def emit(self, out: List[str], depth: int) -> None:
+        pad, inner = _INDENTS[depth], _INDENTS[depth + 1]
+        out.append(f"{pad}Begin {self.kind}")
+        out.extend(f"{inner}{key} ={_format_property(value)}" for key, value in self.props)
+        if self.guid:
+            out.extend((f"{inner}GUID = Begin", f"{_INDENTS[depth + 2]}0x{self.guid}", f"{inner}End"))
+        if self.children:
+            out.append(f"{inner}Begin")
+            for child in self.children:
+                child.emit(out, depth + 2)
+            out.append(f"{inner}End")
+        out.append(f"{pad}End")
+
+class _LayoutDocument:
+    """A complete form or report definition in Access SaveAsText format."""
+
+    def __init__(self, kind: str, props: List[Tuple[str, Any]], record_source: str,
+                 caption: str, sections: List[_LayoutNode]):
+        self.kind = kind
+        self.props = props
+        self.record_source = record_source
+        self.caption = caption
+        self.sections = sections
+        self.guid = uuid.uuid4().hex
+
+    def controls(self):
+        """Yield every control (non-section node) in document order."""
+        for section in self.sections:
+            for node in section.walk():
+                if node.kind != "Section":
+                    yield node
+
+    def serialize(self) -> str:
+        out = [
+            "Version =21",
+            "VersionRequired =20",
+            "PublishOption =1",
+            f"Checksum ={random.randint(-2000000000, 2000000000)}",
+            f"Begin {self.kind}",
+        ]
+        out.extend(f"    {key} ={_format_property(value)}" for key, value in self.props)
+        out.extend(("    GUID = Begin", f"        0x{self.guid}", "    End", "    NameMap = Begin"))
+        entries = [_namemap_entry(node.name) for node in self.controls() if node.name]
+        entries.append(_NAMEMAP_TERMINATOR)
+        out.append(",\n".join(f"        {entry}" for entry in entries))
+        out.extend((
+            "    End",
+            f"    RecordSource ={_format_property(self.record_source)}",
+            f"    Caption ={_format_property(self.caption)}",
+            "    Begin",
+        ))
+        for section in self.sections:
+            section.emit(out, 2)
+        out.extend(("    End", "End"))
+        return "\n".join(out) + "\n"
+
+def _build_form_layout(record_source: str, fields: List[str], form_type: str,
+                       subform_object_name: str = None, link_master_field: str = None,
+                       link_child_field: str = None) -> _LayoutDocument:
+    """Build the layout for a 'single', 'subform' or 'main' form over the given fields."""
+    controls = []
+    y_pos = 200  # Starting Y position for controls
+    for i, field in enumerate(fields):
+        label = _LayoutNode("Label", [
+            ("OverlapFlags", 85), ("Left", 500), ("Top", y_pos), ("Width", 1800), ("Height", 315),
+            ("Name", f"{field}_Label"), ("Caption", field),
+        ])
+        controls.append(_LayoutNode("TextBox", [
+            ("OverlapFlags", 85), ("Left", 2500), ("Top", y_pos), ("Height", 315), ("Width", 3000),
+            ("TabIndex", i), ("Name", field), ("ControlSource", field),
+        ], [label]))
+        y_pos += 400
+
+    if form_type == 'main':
+        controls.append(_LayoutNode("Subform", [
+            ("OverlapFlags", 85), ("Left", 500), ("Top", y_pos + 200), ("Width", 10000), ("Height", 4000),
+            ("TabIndex", len(fields)), ("Name", re.sub(r'^Form\.', '', subform_object_name)),
+            ("SourceObject", subform_object_name), ("LinkChildFields", link_child_field),
+            ("LinkMasterFields", link_master_field),
+        ]))
+
+    detail = _LayoutNode("Section", [
+        ("Height", y_pos + (4500 if form_type == 'main' else 500)), ("Name", "Detail"), ("AutoHeight", -1),
+    ], controls)
+    return _LayoutDocument("Form", [
+        ("DefaultView", 2 if form_type == 'subform' else 0), ("Width", 11500), ("PictureAlignment", 2),
+        ("DatasheetGridlinesBehavior", 3), ("GridY", 10),
+    ], record_source, "__FORM_NAME_PLACEHOLDER__", [detail])
+
+def _build_report_layout(record_source: str, fields: List[str], report_type: str = "tabular") -> _LayoutDocument:
+    """Build the layout for a 'tabular' (default) or 'columnar' report over the given fields."""
+    if report_type.lower() == "columnar":
+        # Columnar layout - fields stacked vertically
+        controls = []
+        y_pos = 500
+        for field in fields:
+            controls.append(_LayoutNode("Label", [
+                ("OverlapFlags", 85), ("Left", 500), ("Top", y_pos), ("Width", 2000), ("Height", 315),
+                ("Name", f"{field}_Label"), ("Caption", f"{field}:"),
+            ]))
+            controls.append(_LayoutNode("TextBox", [
+                ("OverlapFlags", 85), ("Left", 2700), ("Top", y_pos), ("Width", 4000), ("Height", 315),
+                ("Name", field), ("ControlSource", field),
+            ]))
+            y_pos += 400
+        sections = [_LayoutNode("Section", [("Height", y_pos + 200), ("Name", "Detail")], controls)]
+    else:
+        # Tabular layout - header labels over a row of text boxes
+        header_controls, detail_controls = [], []
+        x_pos = 500
+        for field in fields:
+            header_controls.append(_LayoutNode("Label", [
+                ("OverlapFlags", 85), ("Left", x_pos), ("Top", 200), ("Width", 1500), ("Height", 315),
+                ("Name", f"{field}_Header"), ("Caption", field),
+            ]))
+            detail_controls.append(_LayoutNode("TextBox", [
+                ("OverlapFlags", 85), ("Left", x_pos), ("Top", 200), ("Width", 1500), ("Height", 315),
+                ("Name", field), ("ControlSource", field),
+            ]))
+            x_pos += 1600
+        title = _LayoutNode("Label", [
+            ("OverlapFlags", 85), ("Left", 500), ("Top", 200), ("Width", 6000), ("Height", 400),
+            ("Name", "Title"), ("Caption", "__REPORT_NAME_PLACEHOLDER__"), ("FontSize", 14), ("FontWeight", 700),
+        ])
+        sections = [
+            _LayoutNode("Section", [("Height", 600), ("Name", "ReportHeader")], [title]),
+            _LayoutNode("Section", [("Height", 600), ("Name", "PageHeader")], header_controls),
+            _LayoutNode("Section", [("Height", 400), ("Name", "Detail")], detail_controls),
+        ]
+    return _LayoutDocument("Report", [("Width", 7400), ("PictureAlignment", 2)],
+                           record_source, "__REPORT_NAME_PLACEHOLDER__", sections)
+
+# --- SaveAsText Parser ---
+# A single line-by-line pass over an LLM-authored form definition that builds
+# the block tree, rewrites NameMap and invalid GUIDs deterministically and
+# records structural errors with line numbers, so broken input is rejected
+# before Access is launched.
+
+_SAT_BEGIN_BLOCK = re.compile(r'^\s*Begin\s+(\w+)\s*$')
+_SAT_BEGIN_GROUP = re.compile(r'^\s*Begin\s*$')
+_SAT_END = re.compile(r'^\s*End\s*$')
+_SAT_PROPERTY_BLOCK = re.compile(r'^(\s*)(\w+)\s*=\s*Begin\s*$')
+_SAT_PROPERTY = re.compile(r'^\s*(\w+)\s*=\s*(.*?)\s*$')
+_SAT_CONTINUATION = re.compile(r'^\s*"')
+_SAT_GUID = re.compile(r'^[0-9a-fA-F]{32}$')
+
+class _SaveAsTextBlock:
+    """A 'Begin <kind> ... End' block found while parsing a SaveAsText document."""
+
+    def __init__(self, kind: str, line_no: int, parent: Optional["_SaveAsTextBlock"]):
+        self.kind = kind
+        self.line_no = line_no
+        self.parent = parent
+        self.props: Dict[str, str] = {}
+        self.prop_lines: Dict[str, int] = {}
+        self.children: List["_SaveAsTextBlock"] = []
+
+    @property
+    def name(self) -> Optional[str]:
+        value = self.props.get("Name")
+        return value.strip('"') if value else None
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+class _SaveAsTextDocument:
+    """Result of _parse_saveastext: the block tree, the normalized text and any errors."""
+
+    def __init__(self, root: Optional[_SaveAsTextBlock], text: str, names: List[str], errors: List[str]):
+        self.root = root
+        self.text = text
+        self.names = names
+        self.errors = errors
+
+def _parse_saveastext(text: str, object_name: str) -> _SaveAsTextDocument:
+    """Parse a form/report definition in one pass and normalize NameMap and GUIDs.
+
+    NameMap contents are regenerated from every 'Name' property in the
+    document, and GUIDs that are not 32 hex digits are replaced. Both are
+    derived from object_name and the control's position, so the output is
+    stable for the same input. A trailing CodeBehindForm/CodeBehindReport
+    section is VBA and is copied through untouched.
+    """
+    out: List[str] = []
+    errors: List[str] = []
+    names: List[str] = []
+    root: Optional[_SaveAsTextBlock] = None
+    stack: List[Tuple[str, Optional[_SaveAsTextBlock], int]] = []  # (kind, block, line)
+    property_block = None  # (name, indent, line, content lines)
+    namemap_slots: List[Tuple[int, str]] = []
+    lines = text.splitlines()
+
+    def current_block() -> Optional[_SaveAsTextBlock]:
+        for _, block, _ in reversed(stack):
+            if block is not None:
+                return block
+        return None
+
+    for line_no, line in enumerate(lines, 1):
+        if property_block is not None:
+            if not _SAT_END.match(line):
+                property_block[3].append(line)
+                continue
+            prop_name, indent, start_line, content = property_block
+            property_block = None
+            if prop_name == "NameMap":
+                namemap_slots.append((len(out), indent + "    "))
+                out.append("")
+            elif prop_name == "GUID":
+                value = "".join(c.strip() for c in content).replace("0x", "").replace(",", "")
+                if _SAT_GUID.match(value):
+                    out.extend(content)
+                else:
+                    owner = current_block()
+                    seed = f"{object_name}/{owner.kind if owner else ''}/{owner.name if owner else ''}/{start_line}"
+                    out.append(f"{indent}    0x{uuid.uuid5(uuid.NAMESPACE_URL, seed).hex}")
+            else:
+                out.extend(content)
+            out.append(line)
+            continue
+
+        stripped = line.strip()
+        if not stack and root is not None and stripped.startswith("CodeBehind"):
+            out.extend(lines[line_no - 1:])
+            break
+
+        out.append(line)
+        if not stripped or _SAT_CONTINUATION.match(line):
+            continue
+
+        match = _SAT_BEGIN_BLOCK.match(line)
+        if match:
+            parent = current_block()
+            block = _SaveAsTextBlock(match.group(1), line_no, parent)
+            if parent is not None:
+                parent.children.append(block)
+            elif root is None:
+                root = block
+            else:
+                errors.append(f"Line {line_no}: second top-level block 'Begin {block.kind}' (only one is allowed)")
+            stack.append(("block", block, line_no))
+            continue
+
+        if _SAT_BEGIN_GROUP.match(line):
+            if current_block() is None:
+                errors.append(f"Line {line_no}: 'Begin' outside of any block")
+            stack.append(("group", None, line_no))
+            continue
+
+        if _SAT_END.match(line):
+            if not stack:
+                errors.append(f"Line {line_no}: 'End' without matching 'Begin'")
+            else:
+                stack.pop()
+            continue
+
+        match = _SAT_PROPERTY_BLOCK.match(line)
+        if match:
+            property_block = (match.group(2), match.group(1), line_no, [])
+            continue
+
+        match = _SAT_PROPERTY.match(line)
+        if match:
+            block = current_block()
+            if block is not None:
+                block.props[match.group(1)] = match.group(2)
+                block.prop_lines[match.group(1)] = line_no
+                if match.group(1) == "Name":
+                    name_match = re.match(r'^"([^"]+)"', match.group(2))
+                    if name_match:
+                        names.append(name_match.group(1))
+            continue
+
+        errors.append(f"Line {line_no}: unrecognized line: {stripped[:60]}")
+
+    if property_block is not None:
+        errors.append(f"Line {property_block[2]}: '{property_block[0]} = Begin' is never closed")
+    for kind, block, line_no in reversed(stack):
+        label = f"Begin {block.kind}" if block is not None else "Begin"
+        errors.append(f"Line {line_no}: '{label}' is never closed")
+    if root is None:
+        errors.append("Line 1: no 'Begin Form' or 'Begin Report' block found")
+
+    if namemap_slots:
+        entries = [_namemap_entry(name, f"{object_name}/{index}/{name}") for index, name in enumerate(names)]
+        entries.append(_NAMEMAP_TERMINATOR)
+        for position, indent in namemap_slots:
+            out[position] = ",\n".join(f"{indent}{entry}" for entry in entries)
+
+    return _SaveAsTextDocument(root, "\n".join(out) + "\n", names, errors)
+
+# --- SaveAsText Validator ---
+# Checks a parsed definition against what LoadFromText accepts, without Access:
+# structure (from the parser), known block types, and bound ControlSource
+# fields against the RecordSource schema. Unknown property names are only
+# warnings because Access has far more properties than are listed here.
+
+_SAT_BLOCK_KINDS = {
+    "Form", "Report", "Section", "FormHeader", "FormFooter", "PageHeader", "PageFooter", "BreakHeader",
+    "BreakFooter", "BreakLevel", "Label", "TextBox", "ComboBox", "ListBox", "CheckBox", "OptionGroup",
+    "OptionButton", "ToggleButton", "CommandButton", "Subform", "Subreport", "Image", "Line", "Rectangle",
+    "Tab", "TabCtl", "Page", "PageBreak", "BoundObjectFrame", "UnboundObjectFrame", "ObjectFrame",
+    "Attachment", "WebBrowser", "NavigationControl", "NavigationButton", "Chart", "CustomControl",
+    "EmptyCell", "ClassModule",
+}
+
+_SAT_KNOWN_PROPERTIES = {
+    "Version", "VersionRequired", "PublishOption", "Checksum", "Name", "Caption", "RecordSource",
+    "ControlSource", "DefaultView", "Width", "Height", "Left", "Top", "TabIndex", "OverlapFlags",
+    "PictureAlignment", "DatasheetGridlinesBehavior", "GridX", "GridY", "AutoHeight", "FontSize",
+    "FontWeight", "FontName", "FontItalic", "FontUnderline", "ForeColor", "BackColor", "BackStyle",
+    "BorderColor", "BorderStyle", "BorderWidth", "SpecialEffect", "TextAlign", "Format", "DecimalPlaces",
+    "InputMask", "DefaultValue", "ValidationRule", "ValidationText", "StatusBarText", "ControlTipText",
+    "Visible", "Enabled", "Locked", "TabStop", "SourceObject", "LinkChildFields", "LinkMasterFields",
+    "RowSource", "RowSourceType", "BoundColumn", "ColumnCount", "ColumnWidths", "ColumnHeads",
+    "LimitToList", "ListRows", "ListWidth", "OptionValue", "AllowEdits", "AllowDeletions",
+    "AllowAdditions", "DataEntry", "RecordSelectors", "NavigationButtons", "DividingLines", "ScrollBars",
+    "AutoCenter", "AutoResize", "PopUp", "Modal", "ControlBox", "MinMaxButtons",
+    "CloseButton", "HasModule", "OrderBy", "OrderByOn", "Filter", "FilterOn", "CanGrow", "CanShrink",
+    "KeepTogether", "ForceNewPage", "NewRowOrCol", "RepeatSection", "GroupHeader", "GroupFooter",
+    "GroupOn", "GroupInterval", "SortOrder", "RunningSum", "HideDuplicates", "OnClick", "OnCurrent",
+    "OnLoad", "OnOpen", "OnClose", "AfterUpdate", "BeforeUpdate", "OnChange", "OnEnter", "OnExit",
+    "OnGotFocus", "OnLostFocus", "OnDblClick", "OnFormat", "OnPrint", "OnNoData", "Picture",
+    "PictureType", "SizeMode", "Tag", "IsHyperlink", "DisplayAsHyperlink", "LayoutCachedLeft",
+    "LayoutCachedTop", "LayoutCachedWidth", "LayoutCachedHeight", "ThemeFontIndex", "BackThemeColorIndex",
+    "BorderThemeColorIndex", "ForeThemeColorIndex", "GridlineThemeColorIndex", "AlternateBackColor",
+    "AlternateBackThemeColorIndex", "AlternateBackShade", "Shape", "Gradient", "LeftPadding", "TopPadding",
+    "RightPadding", "BottomPadding", "GridlineStyleLeft", "GridlineStyleTop", "GridlineStyleRight",
+    "GridlineStyleBottom", "HorizontalAnchor", "VerticalAnchor", "ItemSelected", "PrtMip", "PrtDevMode",
+    "PrtDevNames", "PrtDevModeW", "PrtDevNamesW", "Cycle", "ViewsAllowed", "FilterOnLoad",
+    "OrderByOnLoad", "SplitFormOrientation", "SplitFormDatasheet", "SplitFormPrinting", "SplitFormSize",
+    "AllowLayoutView", "AllowDatasheetView", "AllowFormView", "DatasheetFontName", "DatasheetFontHeight",
+    "Moveable", "TextFontCharSet", "ImeSentenceMode", "PageHeader", "PageFooter", "DateGrouping",
+    "GrpKeepTogether", "Orientation", "DisplayOnSharePointSite", "ShowPageMargins", "RecSrcDt",
+}
+
+# Column names keyed by (normalized db path, lower-case record source); each entry
+# remembers the database file mtime it was read at.
+_schema_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+
+# Driver message for a FROM source that does not exist (SQLSTATE 42S02)
+_MISSING_SOURCE = re.compile(r"42S02|cannot find the input table or query", re.I)
+
+def _get_cached_table_schema(db_name: str, record_source: str) -> List[str]:
+    """Column names for a table or query, cached until the database file changes."""
+    path = get_db_path(db_name)
+    key = (os.path.normcase(path), record_source.lower())
+    mtime = os.path.getmtime(path)
+    cached = _schema_cache.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    columns = _get_table_schemas(db_name, [record_source])[record_source]
+    _schema_cache[key] = (mtime, columns)
+    return columns
+
+def _format_issue_list(issues: List[str], limit: int = 20) -> str:
+    """Render validation issues as a bullet list, truncated after limit entries."""
+    shown = "\n".join(f"- {issue}" for issue in issues[:limit])
+    if len(issues) > limit:
+        shown += f"\n- ... and {len(issues) - limit} more"
+    return shown
+
+def _validate_saveastext(db_name: Optional[str], document: _SaveAsTextDocument, expected_kind: str) -> Tuple[List[str], List[str]]:
+    """Validate a parsed form/report definition without opening Access.
+
+    Args:
+        db_name: Database used to check ControlSource fields; None skips the schema check
+        document: Result of _parse_saveastext
+        expected_kind: 'Form' or 'Report'
+
+    Returns:
+        Tuple of (errors, warnings); any error means LoadFromText would fail
+    """
+    errors = list(document.errors)
+    warnings: List[str] = []
+    root = document.root
+    if root is None:
+        return errors, warnings
+    if root.kind != expected_kind:
+        errors.append(f"Line {root.line_no}: expected 'Begin {expected_kind}', found 'Begin {root.kind}'")
+
+    fields = None
+    record_source = root.props.get("RecordSource", "").strip('"')
+    if db_name and record_source and not record_source.lower().lstrip().startswith("select"):
+        try:
+            fields = {f.lower() for f in _get_cached_table_schema(db_name, record_source)}
+        except Exception as e:
+            # Only a source the driver cannot find is a definite error; a locked file,
+            # missing driver or parameter query says nothing about the object text
+            line = root.prop_lines['RecordSource']
+            if _MISSING_SOURCE.search(str(e)):
+                errors.append(f"Line {line}: RecordSource '{record_source}' is not a table or query in the database")
+            else:
+                warnings.append(f"Line {line}: could not check RecordSource '{record_source}', "
+                                f"field names not verified: {e}")
+
+    for block in root.walk():
+        if block.kind not in _SAT_BLOCK_KINDS:
+            errors.append(f"Line {block.line_no}: unknown block type 'Begin {block.kind}'")
+        for prop in block.props:
+            if prop not in _SAT_KNOWN_PROPERTIES:
+                warnings.append(f"Line {block.prop_lines[prop]}: unrecognized property '{prop}' in {block.kind}")
+        control_source = block.props.get("ControlSource", "").strip('"')
+        if fields is not None and control_source and not control_source.startswith("="):
+            if control_source.strip("[]").lower() not in fields:
+                errors.append(
+                    f"Line {block.prop_lines['ControlSource']}: ControlSource '{control_source}' of "
+                    f"{block.kind} '{block.name}' is not a field of '{record_source}'"
+                )
+    return errors, warnings
+
+@mcp.tool
+def validate_object_text(db_name: str, object_text: str, object_type: str = "form") -> str:
+    """Check a form or report text definition without opening Access.
+
+    Reports unbalanced Begin/End blocks, unknown control types and ControlSource
+    fields missing from the RecordSource, with line numbers. Use this before
+    create_form_from_llm_text or create_report_from_template to catch mistakes
+    in milliseconds.
+
+    Args:
+        db_name: Database name or path (used to check field names)
+        object_text: The complete text definition
+        object_type: 'form' (default) or 'report'
+    """
+    if object_type.lower() not in ("form", "report"):
+        return "Error: object_type must be 'form' or 'report'"
+    kind = object_type.capitalize()
+    document = _parse_saveastext(object_text, "__validate__")
+    errors, warnings = _validate_saveastext(db_name, document, kind)
+    lines = [f"{kind} text is {'invalid' if errors else 'valid'} ({len(errors)} errors, {len(warnings)} warnings)"]
+    if errors:
+        lines.append("Errors:")
+        lines.append(_format_issue_list(errors))
+    if warnings:
+        lines.append("Warnings:")
+        lines.append(_format_issue_list(warnings))
+    return "\n".join(lines)
+
 @mcp.tool
 def generate_form_template(
     db_name: str, 
@@ -892,13 +3517,6 @@ def generate_form_template(
     except Exception as e:
         return f"Error getting schema for record source '{record_source}': {e}"
 
-    form_guid = str(uuid.uuid4()).replace('-', '')
-    
-    # --- Generate Controls and NameMap ---
-    controls_text = ""
-    namemap_entries = []
-    y_pos = 200 # Starting Y position for controls
-    
     # For a main form, we only want specific fields as per the user request.
     # This logic can be enhanced, but for this specific request, we'll customize it.
     # A more advanced version might take a list of fields as an argument.
@@ -906,96 +3524,11 @@ def generate_form_template(
     if form_type == 'main' and record_source == 'movements':
         fields_to_show = ['ProductID', 'ProductName']
 
+    template = _build_form_layout(
+        record_source, fields_to_show, form_type,
+        subform_object_name, link_master_field, link_child_field
+    ).serialize()
 
-    for i, field in enumerate(fields_to_show):
-        controls_text += f"""
-                Begin TextBox
-                    OverlapFlags =85
-                    Left =2500
-                    Top ={y_pos}
-                    Height =315
-                    Width = 3000
-                    TabIndex ={i}
-                    Name ="{field}"
-                    ControlSource ="{field}"
-                    GUID = Begin
-                        0x{uuid.uuid4().hex}
-                    End
-                    Begin
-                        Begin Label
-                            OverlapFlags =85
-                            Left =500
-                            Top ={y_pos}
-                            Width =1800
-                            Height =315
-                            Name ="{field}_Label"
-                            Caption ="{field}"
-                            GUID = Begin
-                                0x{uuid.uuid4().hex}
-                            End
-                        End
-                    End
-                End"""
-        rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-        field_hex = field.encode('utf-16le').hex()
-        namemap_entries.append(f"0x{rand_hex}{len(field):02x}000000{field_hex}")
-        y_pos += 400
-
-    namemap_text = ",\n        ".join(namemap_entries) + ",\n        0x000000000000000000000000000000000c000000050000000000000000000000000000000000"
-
-    if form_type == 'main':
-        clean_subform_name = re.sub(r'^Form\.', '', subform_object_name)
-        subform_guid = uuid.uuid4().hex
-
-        controls_text += f"""
-                Begin Subform
-                    OverlapFlags =85
-                    Left =500
-                    Top ={y_pos + 200}
-                    Width =10000
-                    Height =4000
-                    TabIndex ={len(fields_to_show)}
-                    Name ="{clean_subform_name}"
-                    SourceObject ="{subform_object_name}"
-                    LinkChildFields ="{link_child_field}"
-                    LinkMasterFields ="{link_master_field}"
-                    GUID = Begin
-                        0x{subform_guid}
-                    End
-                End"""
-
-    view_type = "2" if form_type == 'subform' else "0"
-    
-    template = f"""Version =21
-VersionRequired =20
-PublishOption =1
-Checksum ={random.randint(-2000000000, 2000000000)}
-Begin Form
-    DefaultView ={view_type}
-    Width =11500
-    PictureAlignment =2
-    DatasheetGridlinesBehavior =3
-    GridY =10
-    GUID = Begin
-        0x{form_guid}
-    End
-    NameMap = Begin
-        {namemap_text}
-    End
-    RecordSource ="{record_source}"
-    Caption ="__FORM_NAME_PLACEHOLDER__"
-    Begin
-        Begin Section
-            Height ={y_pos + (4500 if form_type == 'main' else 500)}
-            Name ="Detail"
-            AutoHeight= -1
-            Begin
-                {controls_text}
-            End
-        End
-    End
-End
-"""
     _template_generated = True
     _last_template_type = form_type
     
@@ -1018,6 +3551,9 @@ def create_form_from_llm_text(db_name: str, form_name: str, form_text: str) -> s
     
     This tool will automatically correct/generate the NameMap and GUIDs based on the
     controls found in the form_text, making it robust against LLM-generated errors.
+    Unbalanced Begin/End blocks, unknown control types and ControlSource fields
+    missing from the RecordSource are reported with line numbers before Access
+    is opened.
     
     Args:
         db_name: The name of the database file (e.g., 'inventory.accdb'). Can be an absolute path.
@@ -1043,119 +3579,362 @@ def create_form_from_llm_text(db_name: str, form_name: str, form_text: str) -> s
     
     # --- PRE-PROCESSING AND VALIDATION ---
     try:
-        logger.info(f"Pre-processing form: {form_name}")
-        
-        # 1. Replace placeholder if it exists
-        if "__FORM_NAME_PLACEHOLDER__" in form_text:
-             form_text = form_text.replace("__FORM_NAME_PLACEHOLDER__", form_name)
+        logger.info(f"Pre-processing form: {form_name}")
+        
+        # 1. Replace placeholder if it exists
+        if "__FORM_NAME_PLACEHOLDER__" in form_text:
+             form_text = form_text.replace("__FORM_NAME_PLACEHOLDER__", form_name)
+
+        # 2. Parse once: rebuild the NameMap, fix GUIDs and check structure
+        document = _parse_saveastext(form_text, form_name)
+        errors, warnings = _validate_saveastext(db_name, document, "Form")
+        for warning in warnings:
+            logger.warning(f"Form '{form_name}': {warning}")
+        if errors:
+            logger.error(f"Form text has {len(errors)} error(s)")
+            return f"Error: Form text is invalid (not sent to Access):\n{_format_issue_list(errors)}"
+        if not document.names:
+            logger.error("No named controls found in form text")
+            return "Error: Could not find any named controls in the form text to build a NameMap."
+        form_text = document.text
+        
+        logger.debug("Form text pre-processing completed")
+
+    except Exception as e:
+        logger.error(f"Error during form pre-processing: {e}")
+        return f"An unexpected error occurred during pre-processing: {e}"
+
+    def operation(access):
+        """Inner function to create the form"""
+        logger.info(f"Creating form: {form_name}")
+        _load_object_from_text(access, AC_FORM, form_name, form_text)
+        
+        global _template_generated, _last_template_type
+        _template_generated = False
+        _last_template_type = None
+
+        return f"Form '{form_name}' created successfully in database '{db_name}'."
+
+    try:
+        path = get_db_path(db_name)
+        
+        # Check for lock
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path)
+            if not success:
+                return f"Error: {message}"
+        
+        result = _with_access_database(db_name, operation)
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error creating form '{form_name}': {e}")
+        return f"Error creating form from text: {str(e)}"
+
+@mcp.tool
+def create_forms_for_tables(
+    db_name: str,
+    record_sources: list[str] = None,
+    form_type: str = "single",
+    form_name_suffix: str = "Form"
+) -> str:
+    """Create one form per record source in a single Access session.
+
+    Templates are generated from one schema lookup and all forms are loaded
+    with LoadFromText without reopening Access. A failure on one form does not
+    stop the others.
+
+    Args:
+        db_name: Database name or path
+        record_sources: Tables or saved queries to build forms for; omit for all tables
+        form_type: 'single' (default) or 'subform'
+        form_name_suffix: Appended to each record source to name its form (default 'Form')
+
+    Returns:
+        Per-form result lines with timings and a summary
+    """
+    is_valid, error_msg = _validate_database_name(db_name)
+    if not is_valid:
+        return f"Error: {error_msg}"
+    if form_type not in ['single', 'subform']:
+        return "Error: form_type must be 'single' or 'subform' for bulk creation."
+
+    try:
+        path = get_db_path(db_name)
+        if not os.path.exists(path):
+            return f"Error: Database not found at {path}"
+        sources = record_sources or _list_user_tables(db_name)
+        if not sources:
+            return "No tables found"
+        schema_errors: Dict[str, str] = {}
+        schemas = _get_table_schemas(db_name, sources, schema_errors)
+    except Exception as e:
+        return f"Error getting schemas: {e}"
+
+    forms = []
+    failed_lines = []
+    for source in sources:
+        form_name = f"{source}{form_name_suffix}"
+        if source in schema_errors:
+            failed_lines.append(f"✗ {form_name}: {schema_errors[source]}")
+            continue
+        layout = _build_form_layout(source, schemas[source], form_type)
+        forms.append((form_name, layout.serialize().replace("__FORM_NAME_PLACEHOLDER__", form_name)))
+    if not forms:
+        return "\n".join(failed_lines + [f"Created 0 of {len(sources)} forms in database '{db_name}'."])
+
+    def operation(access):
+        lines = list(failed_lines)
+        created = 0
+        for (form_name, _), file_path in zip(forms, file_paths):
+            start = time.perf_counter()
+            try:
+                _load_object_from_file(access, AC_FORM, form_name, file_path)
+                created += 1
+                lines.append(f"✓ {form_name} ({time.perf_counter() - start:.2f}s)")
+            except Exception as e:
+                logger.error(f"Error creating form '{form_name}': {e}")
+                lines.append(f"✗ {form_name} ({time.perf_counter() - start:.2f}s): {e}")
+        lines.append(f"Created {created} of {len(sources)} forms in database '{db_name}'.")
+        return "\n".join(lines)
+
+    file_paths: List[str] = []
+    try:
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path)
+            if not success:
+                return f"Error: {message}"
+        file_paths = _scratch.write_many([form_text for _, form_text in forms])
+        return _with_access_database(db_name, operation)
+    except Exception as e:
+        logger.error(f"Error creating forms: {e}")
+        return f"Error creating forms: {str(e)}"
+    finally:
+        _scratch.remove(file_paths)
+
+@mcp.tool
+def export_database_objects(
+    db_name: str,
+    output_dir: str,
+    object_types: list[str] = None,
+    name_filter: str = None
+) -> str:
+    """Export forms, reports, queries, macros and modules as text in one Access session.
+
+    Each object is written with SaveAsText to <output_dir>/<forms|reports|queries|macros|modules>/.
+    Files are hashed on a worker thread while Access exports the next chunk, and a
+    manifest.json with SHA-256 hashes of every file is written to output_dir.
+
+    Args:
+        db_name: Database name or path
+        output_dir: Directory to export into (created if missing)
+        object_types: Any of 'form', 'report', 'query', 'macro', 'module'; omit for all
+        name_filter: Optional wildcard on object names, e.g. 'frm*'
+
+    Returns:
+        Export summary with per-type counts and any failures
+    """
+    is_valid, error_msg = _validate_database_name(db_name)
+    if not is_valid:
+        return f"Error: {error_msg}"
+    types = [t.lower() for t in (object_types or list(_DESIGN_OBJECT_TYPES))]
+    unknown = [t for t in types if t not in _DESIGN_OBJECT_TYPES]
+    if unknown:
+        return f"Error: Unknown object type(s) {unknown}; use {list(_DESIGN_OBJECT_TYPES)}"
+
+    path = get_db_path(db_name)
+    if not os.path.exists(path):
+        return f"Error: Database not found at {path}"
+    output_dir = os.path.abspath(output_dir)
+
+    def operation(access):
+        entries: List[Dict[str, Any]] = []
+        failures: List[str] = []
+        with ThreadPoolExecutor(max_workers=2) as hasher:
+            futures = []
+            for object_type in types:
+                ac_type, sub_dir, extension = _DESIGN_OBJECT_TYPES[object_type]
+                names = [n for n in _list_design_objects(access, object_type)
+                         if not name_filter or fnmatch.fnmatch(n.lower(), name_filter.lower())]
+                os.makedirs(os.path.join(output_dir, sub_dir), exist_ok=True)
+                for chunk_start in range(0, len(names), Config.EXPORT_CHUNK_SIZE):
+                    chunk = []
+                    for name in names[chunk_start:chunk_start + Config.EXPORT_CHUNK_SIZE]:
+                        relative = f"{sub_dir}/{_safe_file_name(name)}{extension}"
+                        try:
+                            access.SaveAsText(ac_type, name, os.path.join(output_dir, relative))
+                            chunk.append((object_type, name, relative))
+                        except Exception as e:
+                            logger.error(f"Error exporting {object_type} '{name}': {e}")
+                            failures.append(f"{object_type} '{name}': {e}")
+                    futures.append(hasher.submit(
+                        lambda items: [(t, n, r, *_hash_file(os.path.join(output_dir, r))) for t, n, r in items],
+                        chunk))
+            for future in futures:
+                for object_type, name, relative, sha256, size in future.result():
+                    entries.append({"type": object_type, "name": name, "file": relative,
+                                    "sha256": sha256, "bytes": size})
+
+        manifest = {
+            "database": path,
+            "exported_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "objects": entries,
+        }
+        with open(os.path.join(output_dir, _MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+
+        counts = {t: sum(1 for e in entries if e["type"] == t) for t in types}
+        lines = [f"Exported {len(entries)} objects to {output_dir}:"]
+        lines.extend(f"- {t}: {counts[t]}" for t in types)
+        lines.append(f"Manifest: {os.path.join(output_dir, _MANIFEST_FILE)}")
+        if failures:
+            lines.append(f"Failed ({len(failures)}):")
+            lines.extend(f"- {failure}" for failure in failures)
+        return "\n".join(lines)
+
+    try:
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path, read_only=True)
+            if not success:
+                return f"Error: {message}"
+        return _with_access_database(db_name, operation)
+    except Exception as e:
+        logger.error(f"Error exporting objects: {e}")
+        return f"Error exporting objects: {str(e)}"
 
-        # 2. Find all controls with a 'Name' property
-        control_names = re.findall(r'^\s*Name\s*=\s*"([^"]+)"', form_text, re.MULTILINE)
-        if not control_names:
-            logger.error("No named controls found in form text")
-            return "Error: Could not find any named controls in the form text to build a NameMap."
+def _sync_manifest_path(db_path: str) -> str:
+    """Where sync_database_objects records what it last applied to a database."""
+    return db_path + ".sync.json"
 
-        # 3. Generate a fresh, correct NameMap
-        namemap_entries = []
-        for name in control_names:
-            rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-            field_hex = name.encode('utf-16le').hex()
-            namemap_entries.append(f"0x{rand_hex}{len(name):02x}000000{field_hex}")
-        
-        # Add the required terminator for the NameMap
-        namemap_terminator = "0x000000000000000000000000000000000c000000050000000000000000000000000000000000"
-        namemap_entries.append(namemap_terminator)
-        
-        new_namemap_text = "NameMap = Begin\n        " + ",\n        ".join(namemap_entries) + "\n    End"
+@mcp.tool
+def sync_database_objects(db_name: str, source_dir: str, delete_missing: bool = False, dry_run: bool = False) -> str:
+    """Apply only the changed design objects from a directory of text sources.
 
-        # 4. Replace the old NameMap in the text with our new, correct one
-        form_text = re.sub(r'NameMap\s*=\s*Begin.*?End', new_namemap_text, form_text, flags=re.DOTALL)
+    source_dir uses the layout written by export_database_objects
+    (forms/, reports/, queries/, macros/, modules/). Each file's SHA-256 is
+    compared with the manifest recorded for the target database by the last
+    sync (or, on first sync, with the manifest.json of an export of that same
+    database). Only new or changed objects are reloaded, all in one Access
+    session, and modules are compiled once at the end.
 
-        # 5. Find and fix all GUIDs
-        def replace_guid(match):
-            guid_content = match.group(1).strip().replace('0x', '')
-            if len(guid_content) == 32 and all(c in '0123456789abcdefABCDEF' for c in guid_content):
-                return match.group(0)
-            else:
-                return f"GUID = Begin\n            0x{uuid.uuid4().hex}\n        End"
+    Args:
+        db_name: Target database name or path
+        source_dir: Directory of SaveAsText/VBA sources
+        delete_missing: Also delete objects that were synced before but no longer have a source file
+        dry_run: Report the delta without changing the database
 
-        form_text = re.sub(r'GUID\s*=\s*Begin(.*?)End', replace_guid, form_text, flags=re.DOTALL)
-        
-        logger.debug("Form text pre-processing completed")
+    Returns:
+        Summary of applied, unchanged and failed objects
+    """
+    is_valid, error_msg = _validate_database_name(db_name)
+    if not is_valid:
+        return f"Error: {error_msg}"
+    path = get_db_path(db_name)
+    if not os.path.exists(path):
+        return f"Error: Database not found at {path}"
+    source_dir = os.path.abspath(source_dir)
+    if not os.path.isdir(source_dir):
+        return f"Error: Source directory not found: {source_dir}"
 
+    # Baseline: last sync, else an export of this very database
+    baseline: Dict[str, Dict[str, Any]] = {}
+    export_names: Dict[str, str] = {}
+    try:
+        export_manifest_path = os.path.join(source_dir, _MANIFEST_FILE)
+        if os.path.exists(export_manifest_path):
+            with open(export_manifest_path, encoding="utf-8") as f:
+                export_manifest = json.load(f)
+            export_names = {e["file"]: e["name"] for e in export_manifest.get("objects", [])}
+            if os.path.normcase(export_manifest.get("database", "")) == os.path.normcase(path):
+                baseline = {e["file"]: e for e in export_manifest["objects"]}
+        if os.path.exists(_sync_manifest_path(path)):
+            with open(_sync_manifest_path(path), encoding="utf-8") as f:
+                baseline = {e["file"]: e for e in json.load(f).get("objects", [])}
     except Exception as e:
-        logger.error(f"Error during form pre-processing: {e}")
-        return f"An unexpected error occurred during pre-processing: {e}"
+        return f"Error reading manifest: {e}"
+
+    current: Dict[str, Dict[str, Any]] = {}
+    for object_type, (_, sub_dir, extension) in _DESIGN_OBJECT_TYPES.items():
+        type_dir = os.path.join(source_dir, sub_dir)
+        if not os.path.isdir(type_dir):
+            continue
+        for file_name in sorted(os.listdir(type_dir)):
+            if not file_name.endswith(extension):
+                continue
+            relative = f"{sub_dir}/{file_name}"
+            sha256, size = _hash_file(os.path.join(type_dir, file_name))
+            name = export_names.get(relative, file_name[:-len(extension)])
+            current[relative] = {"type": object_type, "name": name, "file": relative, "sha256": sha256, "bytes": size}
+
+    changed = [e for f, e in current.items() if baseline.get(f, {}).get("sha256") != e["sha256"]]
+    removed = [e for f, e in baseline.items() if f not in current] if delete_missing else []
+    unchanged = len(current) - len(changed)
+
+    summary = [f"{len(changed)} changed/new, {unchanged} unchanged, {len(removed)} to delete"]
+    if dry_run or (not changed and not removed):
+        summary.extend(f"- {'would apply' if dry_run else 'apply'} {e['type']} '{e['name']}'" for e in changed)
+        summary.extend(f"- would delete {e['type']} '{e['name']}'" for e in removed)
+        if not changed and not removed:
+            summary.append("Database is already in sync; Access was not opened.")
+        return "\n".join(summary)
 
     def operation(access):
-        """Inner function to create the form"""
-        logger.info(f"Creating form: {form_name}")
-        
-        # Write to temp file
-        temp_file_path = None
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".txt", encoding='utf-8') as tf:
-                tf.write(form_text)
-                temp_file_path = tf.name
-            
-            AC_FORM = 2
-            
-            # Delete existing form if it exists
+        lines = []
+        applied: Dict[str, Dict[str, Any]] = {}
+        deleted: List[str] = []
+        for entry in changed:
+            ac_type = _DESIGN_OBJECT_TYPES[entry["type"]][0]
+            start = time.perf_counter()
             try:
-                access.DoCmd.DeleteObject(AC_FORM, form_name)
-                logger.debug(f"Deleted existing form: {form_name}")
-            except Exception:
-                logger.debug(f"Form {form_name} doesn't exist (creating new)")
-
-            # Load form from text file
-            access.LoadFromText(AC_FORM, form_name, temp_file_path)
-            logger.info(f"Form '{form_name}' created successfully")
-            
-            global _template_generated, _last_template_type
-            _template_generated = False
-            _last_template_type = None
+                _load_object_from_file(access, ac_type, entry["name"], os.path.join(source_dir, entry["file"]))
+                applied[entry["file"]] = entry
+                lines.append(f"✓ {entry['type']} '{entry['name']}' ({time.perf_counter() - start:.2f}s)")
+            except Exception as e:
+                logger.error(f"Error applying {entry['type']} '{entry['name']}': {e}")
+                lines.append(f"✗ {entry['type']} '{entry['name']}': {e}")
+        for entry in removed:
+            try:
+                access.DoCmd.DeleteObject(_DESIGN_OBJECT_TYPES[entry["type"]][0], entry["name"])
+                _invalidate_vba_index(access)
+                deleted.append(entry["file"])
+                lines.append(f"✓ deleted {entry['type']} '{entry['name']}'")
+            except Exception as e:
+                lines.append(f"✗ delete {entry['type']} '{entry['name']}': {e}")
+        if any(e["type"] == "module" for e in applied.values()):
+            try:
+                access.DoCmd.RunCommand(AC_CMD_COMPILE_AND_SAVE_ALL_MODULES)
+            except Exception as e:
+                logger.warning(f"Could not compile VBA (may have errors): {e}")
+                lines.append(f"⚠ VBA compile failed: {e}")
 
-            return f"Form '{form_name}' created successfully in database '{db_name}'."
-            
-        finally:
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-                logger.debug("Temp file cleaned up")
+        # Record what the database now holds; failed objects keep their old hash
+        recorded = {f: e for f, e in baseline.items() if f not in deleted}
+        recorded.update(applied)
+        with open(_sync_manifest_path(path), "w", encoding="utf-8") as f:
+            json.dump({"database": path, "source_dir": source_dir,
+                       "synced_at": datetime.datetime.now().isoformat(timespec="seconds"),
+                       "objects": list(recorded.values())}, f, indent=2)
+        return "\n".join(summary + lines)
 
     try:
-        path = get_db_path(db_name)
-        
-        # Check for lock
         if is_database_locked(path):
             success, message = wait_for_lock_release(path)
             if not success:
                 return f"Error: {message}"
-        
-        result = _with_access_database(db_name, operation)
-        return result
-        
+        return _with_access_database(db_name, operation)
     except Exception as e:
-        logger.error(f"Error creating form '{form_name}': {e}")
-        return f"Error creating form from text: {str(e)}"
+        logger.error(f"Error syncing objects: {e}")
+        return f"Error syncing objects: {str(e)}"
 
 @mcp.tool
 def list_vba_modules(db_name: str) -> str:
     """List all VBA modules in the Access database"""
     
     def operation(access):
-        project = access.VBE.VBProjects(1)
-        
         modules = []
-        for i in range(1, project.VBComponents.Count + 1):
-            component = project.VBComponents(i)
-            module_type = {
-                1: "Standard Module",
-                2: "Class Module", 
-                3: "Form Module",
-                100: "Document Module"
-            }.get(component.Type, f"Type {component.Type}")
-            
-            modules.append(f"- {component.Name} ({module_type})")
+        for entry in _get_vba_index(access).entries():
+            module_type = _VBA_MODULE_TYPES.get(entry["type"], f"Type {entry['type']}")
+            modules.append(f"- {entry['name']} ({module_type}, {entry['lines']} lines)")
         
         if modules:
             return "VBA Modules:\n" + "\n".join(modules)
@@ -1165,7 +3944,7 @@ def list_vba_modules(db_name: str) -> str:
     try:
         path = get_db_path(db_name)
         if is_database_locked(path):
-            success, message = wait_for_lock_release(path, timeout=10)
+            success, message = wait_for_lock_release(path, timeout=10, read_only=True)
             if not success:
                 return f"Error: {message}"
         
@@ -1180,24 +3959,22 @@ def read_vba_module(db_name: str, module_name: str) -> str:
     """Read the code from a specific VBA module"""
     
     def operation(access):
-        project = access.VBE.VBProjects(1)
-        
-        # Find the specific module
-        for i in range(1, project.VBComponents.Count + 1):
-            component = project.VBComponents(i)
-            if component.Name.lower() == module_name.lower():
-                if component.CodeModule.CountOfLines > 0:
-                    code = component.CodeModule.Lines(1, component.CodeModule.CountOfLines)
-                    return f"VBA Code from module '{module_name}':\n\n{code}"
-                else:
-                    return f"Module '{module_name}' exists but is empty"
-        
-        return f"Module '{module_name}' not found"
+        component = _get_vba_index(access).get(module_name)
+        if component is None:
+            return f"Module '{module_name}' not found"
+
+        code_module = component.CodeModule
+        line_count = code_module.CountOfLines
+        if line_count > 0:
+            code = code_module.Lines(1, line_count)
+            return f"VBA Code from module '{module_name}':\n\n{code}"
+        else:
+            return f"Module '{module_name}' exists but is empty"
     
     try:
         path = get_db_path(db_name)
         if is_database_locked(path):
-            success, message = wait_for_lock_release(path, timeout=10)
+            success, message = wait_for_lock_release(path, timeout=10, read_only=True)
             if not success:
                 return f"Error: {message}"
         
@@ -1208,7 +3985,7 @@ def read_vba_module(db_name: str, module_name: str) -> str:
         return f"Error reading VBA module '{module_name}': {str(e)}"
 
 @mcp.tool
-def write_vba_module(db_name: str, module_name: str, code: str) -> str:
+def write_vba_module(db_name: str, module_name: str, code: str, incremental: bool = True) -> str:
     """Create or replace a VBA module with the provided code.
     
     Automatically saves and closes the database to prevent lock issues.
@@ -1218,6 +3995,8 @@ def write_vba_module(db_name: str, module_name: str, code: str) -> str:
         db_name: Database name or path
         module_name: Name for the VBA module (must be valid VBA identifier)
         code: VBA code to write
+        incremental: Only rewrite changed lines, and skip the save and compile
+                     when the code is identical (default True). False replaces the whole module.
         
     Returns:
         Success or error message
@@ -1244,58 +4023,14 @@ def write_vba_module(db_name: str, module_name: str, code: str) -> str:
     def operation(access):
         """Inner function that does the actual work"""
         logger.info(f"Writing VBA module: {module_name}")
+        action = _write_vba_code(_get_vba_index(access), module_name, cleaned_code, incremental)
+        if action == "unchanged":
+            return f"VBA module '{module_name}' is unchanged (nothing written)"
+        _save_vba_module(access, module_name)
+        compiled, compile_error = _compile_vba_project(access)
         
-        # Access the VBA project
-        project = access.VBE.VBProjects(1)
-        
-        # Check if module already exists
-        module_exists = False
-        component_to_save = None
-        
-        for i in range(1, project.VBComponents.Count + 1):
-            component = project.VBComponents(i)
-            if component.Name.lower() == module_name.lower():
-                # Clear existing code
-                if component.CodeModule.CountOfLines > 0:
-                    component.CodeModule.DeleteLines(1, component.CodeModule.CountOfLines)
-                # Add new code (cleaned)
-                component.CodeModule.AddFromString(cleaned_code)
-                module_exists = True
-                component_to_save = component
-                logger.info(f"Updated existing module: {module_name}")
-                break
-        
-        if not module_exists:
-            # Create new standard module
-            new_module = project.VBComponents.Add(1)  # 1 = vbext_ct_StdModule
-            new_module.Name = module_name
-            new_module.CodeModule.AddFromString(cleaned_code)
-            component_to_save = new_module
-            logger.info(f"Created new module: {module_name}")
-        
-        # IMPORTANT: Save the VBA project explicitly
-        try:
-            # Method 1: Try to save the component
-            access.DoCmd.Save(5, module_name)  # 5 = acModule
-            logger.debug(f"Saved VBA module using DoCmd.Save")
-        except Exception as e1:
-            logger.debug(f"DoCmd.Save failed: {e1}, trying alternative")
-            try:
-                # Method 2: Save the database (forces VBA save)
-                access.DoCmd.Save()
-                logger.debug(f"Saved database (includes VBA)")
-            except Exception as e2:
-                logger.debug(f"DoCmd.Save() failed: {e2}, VBA may not be saved")
-        
-        # Force a compile to ensure code is valid
-        try:
-            # This will throw an error if there are compilation errors
-            access.DoCmd.RunCommand(7)  # 7 = acCmdCompileAndSaveAllModules
-            logger.debug("VBA compiled successfully")
-        except Exception as e:
-            logger.warning(f"Could not compile VBA (may have errors): {e}")
-        
-        action = "updated" if module_exists else "created"
+        if not compiled:
+            return f"VBA module '{module_name}' {action}, but the project does not compile: {compile_error}"
         return f"VBA module '{module_name}' {action} successfully"
     
     try:
@@ -1315,19 +4050,182 @@ def write_vba_module(db_name: str, module_name: str, code: str) -> str:
         logger.error(f"Error writing VBA module '{module_name}': {e}")
         return f"Error writing VBA module '{module_name}': {str(e)}"
 
+@mcp.tool
+def read_vba_modules(db_name: str, module_names: list[str] = None) -> str:
+    """Read the code of many VBA modules in a single Access session.
+
+    Args:
+        db_name: Database name or path
+        module_names: Modules to read; omit to read every module in the project
+
+    Returns:
+        Each module's code under a '=== <name> ===' header, plus any that were not found
+    """
+    def operation(access):
+        index = _get_vba_index(access)
+        names = module_names or [entry["name"] for entry in index.entries()]
+        sections = []
+        missing = []
+        for name in names:
+            component = index.get(name)
+            if component is None:
+                missing.append(name)
+                continue
+            code_module = component.CodeModule
+            line_count = code_module.CountOfLines
+            code = code_module.Lines(1, line_count) if line_count > 0 else ""
+            sections.append(f"=== {name} ({line_count} lines) ===\n{code}")
+        if missing:
+            sections.append("Not found: " + ", ".join(missing))
+        return "\n\n".join(sections) if sections else "No VBA modules found"
+
+    try:
+        path = get_db_path(db_name)
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path, timeout=10, read_only=True)
+            if not success:
+                return f"Error: {message}"
+        return _with_access_database(db_name, operation)
+    except Exception as e:
+        return f"Error reading VBA modules: {str(e)}"
+
+@mcp.tool
+def write_vba_modules(db_name: str, modules: list[dict], incremental: bool = True) -> str:
+    """Create or replace many VBA modules in a single Access session.
+
+    Each entry is {'module_name': ..., 'code': ...}. All modules are written and
+    saved first and the project is compiled once at the end. A failing module
+    does not stop the others.
+
+    Args:
+        db_name: Database name or path
+        modules: List of module specifications
+        incremental: Only rewrite changed lines; unchanged modules are skipped and
+                     no compile runs if nothing changed (default True)
+
+    Returns:
+        Per-module result lines and the compile outcome
+    """
+    is_valid, error_msg = _validate_database_name(db_name)
+    if not is_valid:
+        logger.error(f"Invalid database name: {error_msg}")
+        return f"Error: {error_msg}"
+    if not modules:
+        return "Error: modules cannot be empty"
+
+    prepared = []
+    for spec in modules:
+        module_name = spec.get("module_name", "")
+        is_valid, error_msg = _validate_module_name(module_name)
+        if not is_valid:
+            return f"Error: Invalid module name '{module_name}': {error_msg}"
+        if not spec.get("code", "").strip():
+            return f"Error: VBA code for '{module_name}' cannot be empty"
+        prepared.append((module_name, sanitize_vba_code(spec["code"])))
+
+    def operation(access):
+        index = _get_vba_index(access)
+        lines = []
+        written = 0
+        for module_name, cleaned_code in prepared:
+            start = time.perf_counter()
+            try:
+                action = _write_vba_code(index, module_name, cleaned_code, incremental)
+                if action != "unchanged":
+                    _save_vba_module(access, module_name)
+                    written += 1
+                lines.append(f"✓ {module_name} {action} ({time.perf_counter() - start:.2f}s)")
+            except Exception as e:
+                logger.error(f"Error writing VBA module '{module_name}': {e}")
+                lines.append(f"✗ {module_name}: {e}")
+        if written:
+            compiled, compile_error = _compile_vba_project(access)
+            outcome = "compiled successfully." if compiled else f"compile failed: {compile_error}"
+        else:
+            outcome = "nothing changed, compile skipped."
+        lines.append(f"Wrote {written} of {len(prepared)} modules; {outcome}")
+        return "\n".join(lines)
+
+    try:
+        path = get_db_path(db_name)
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path)
+            if not success:
+                return f"Error: {message}"
+        return _with_access_database(db_name, operation)
+    except Exception as e:
+        logger.error(f"Error writing VBA modules: {e}")
+        return f"Error writing VBA modules: {str(e)}"
+
+@mcp.tool
+def check_vba_compilation(db_name: str, use_cache: bool = True) -> dict:
+    """Compile the VBA project once and return structured diagnostics.
+
+    The compile does not save. The result is cached per database: while the
+    database file is untouched, later checks return it without launching
+    Access. If the file changed but no module's code did, Access is opened to
+    hash the modules but the project is not compiled again.
+
+    Args:
+        db_name: Database name or path
+        use_cache: Reuse the previous result when nothing changed (default True)
+
+    Returns:
+        dict with compiled flag, whether the result was cached, module count and
+        diagnostics as [{module, line, column, message}]
+    """
+    path = get_db_path(db_name)
+    cache_key = os.path.normcase(path)
+
+    def operation(access):
+        index = _get_vba_index(access)
+        hashes = _vba_module_hashes(index)
+        cached = _vba_compile_cache.get(cache_key)
+        if use_cache and cached and cached["hashes"] == hashes:
+            return {**cached["result"], "cached": True}
+
+        try:
+            access.DoCmd.RunCommand(AC_CMD_COMPILE_ALL_MODULES)
+            diagnostics = []
+        except Exception as e:
+            diagnostics = _compile_diagnostics(access, e)
+        result = {
+            "success": True,
+            "compiled": not diagnostics,
+            "cached": False,
+            "modules_checked": len(hashes),
+            "diagnostics": diagnostics,
+        }
+        _vba_compile_cache[cache_key] = {"hashes": hashes, "result": result}
+        return result
+
+    try:
+        cached = _vba_compile_cache.get(cache_key)
+        # A batch session edits modules in memory without touching the file
+        if use_cache and cached and not _batch_mode_access and cached.get("fingerprint") == _database_fingerprint(path):
+            return {**cached["result"], "cached": True}
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path, timeout=10)
+            if not success:
+                return {"success": False, "message": message}
+        result = _with_access_database(db_name, operation)
+        if cache_key in _vba_compile_cache and not _batch_mode_access:
+            # Taken after the session closed, so its own save does not count as a change
+            _vba_compile_cache[cache_key]["fingerprint"] = _database_fingerprint(path)
+        return result
+    except Exception as e:
+        return {"success": False, "message": f"Error checking VBA compilation: {str(e)}"}
+
 @mcp.tool
 def delete_vba_module(db_name: str, module_name: str) -> str:
     """Delete a VBA module from the Access database"""
     
     def operation(access):
-        project = access.VBE.VBProjects(1)
-        
-        # Find and delete the module
-        for i in range(1, project.VBComponents.Count + 1):
-            component = project.VBComponents(i)
-            if component.Name.lower() == module_name.lower():
-                project.VBComponents.Remove(component)
-                return f"VBA module '{module_name}' deleted successfully"
+        removed = _get_vba_index(access).remove(module_name)
+        # Other cached components may be renumbered or released by the removal
+        _invalidate_vba_index(access)
+        if removed:
+            return f"VBA module '{module_name}' deleted successfully"
         
         return f"Module '{module_name}' not found"
     
@@ -1345,9 +4243,11 @@ def delete_vba_module(db_name: str, module_name: str) -> str:
         return f"Error deleting VBA module '{module_name}': {str(e)}"
 
 @mcp.tool
-def run_vba_function(db_name: str, function_name: str, args: str = "") -> str:
+def run_vba_function(db_name: str, function_name: str, args: str = "", timeout_seconds: Optional[float] = None) -> str:
     """Execute a VBA function in the Access database and return the result. 
-    Args should be comma-separated values like: 'arg1,arg2,arg3'"""
+    Args should be comma-separated values like: 'arg1,arg2,arg3'
+    If the function is still running after timeout_seconds (default: server
+    setting), the Access instance running it is terminated."""
     
     def operation(access):
         # Parse arguments if provided
@@ -1366,12 +4266,101 @@ def run_vba_function(db_name: str, function_name: str, args: str = "") -> str:
             if not success:
                 return f"Error: {message}"
         
-        result = _with_access_database(db_name, operation)
+        result = _with_access_database(db_name, operation, _call_deadline("run_vba_function", timeout_seconds))
         return result
         
     except Exception as e:
         return f"Error running VBA function '{function_name}': {str(e)}"
 
+def _to_vba_argument(value: Any) -> Any:
+    """Convert a JSON argument to what Access.Run expects.
+
+    {'$date': '2024-01-31'} or {'$date': '2024-01-31T10:00:00'} becomes a
+    Date; lists become VBA arrays; other JSON values map directly.
+    """
+    if isinstance(value, dict) and "$date" in value:
+        return datetime.datetime.fromisoformat(value["$date"])
+    if isinstance(value, list):
+        return tuple(_to_vba_argument(v) for v in value)
+    return value
+
+def _from_vba_result(value: Any) -> Any:
+    """Convert a COM return value to a JSON-friendly value."""
+    if isinstance(value, datetime.datetime):  # pywintypes.TimeType subclasses datetime
+        return {"$date": value.replace(tzinfo=None).isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_from_vba_result(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+@mcp.tool
+def run_vba_functions(db_name: str, calls: list[dict], stop_on_error: bool = False,
+                      timeout_seconds: Optional[float] = None) -> dict:
+    """Execute many VBA functions in one Access session with typed arguments.
+
+    Each call is {'function': 'MyFunc', 'args': [1, 'text', true, {'$date': '2024-01-31'}]}.
+    Arguments keep their JSON types (numbers, strings, booleans, null, lists as
+    arrays, {'$date': ...} as Date). If a batch operation is open for this
+    database (begin_batch_operation), the calls run on that already-open
+    instance instead of launching Access.
+
+    Args:
+        db_name: Database name or path
+        calls: List of calls to make, in order
+        stop_on_error: Stop at the first failing call (default False: run all)
+        timeout_seconds: Deadline for the whole batch (default: server setting); Access is
+            terminated if a call is still running when it passes
+
+    Returns:
+        dict with per-call results ({function, result, type, seconds, error}) and total time
+    """
+    if not calls:
+        return {"success": False, "message": "calls cannot be empty"}
+    for call in calls:
+        if not call.get("function"):
+            return {"success": False, "message": f"Each call needs a 'function' name (got {call})"}
+        if len(call.get("args") or []) > 30:
+            return {"success": False, "message": f"'{call['function']}': Access.Run accepts at most 30 arguments"}
+
+    def operation(access):
+        results = []
+        started = time.perf_counter()
+        for call in calls:
+            start = time.perf_counter()
+            entry = {"function": call["function"], "result": None, "type": None, "error": None}
+            try:
+                args = [_to_vba_argument(a) for a in call.get("args") or []]
+                value = access.Run(call["function"], *args)
+                entry["result"] = _from_vba_result(value)
+                entry["type"] = type(value).__name__
+            except Exception as e:
+                excepinfo = getattr(e, "excepinfo", None)
+                entry["error"] = excepinfo[2] if excepinfo and excepinfo[2] else str(e)
+            entry["seconds"] = round(time.perf_counter() - start, 4)
+            results.append(entry)
+            if entry["error"] and stop_on_error:
+                break
+        failed = sum(1 for r in results if r["error"])
+        return {
+            "success": failed == 0,
+            "calls_run": len(results),
+            "failed": failed,
+            "total_seconds": round(time.perf_counter() - started, 4),
+            "results": results,
+        }
+
+    try:
+        path = get_db_path(db_name)
+        warm = _batch_mode_access is not None and _batch_mode_db == db_name
+        if not warm and is_database_locked(path):
+            success, message = wait_for_lock_release(path, timeout=10)
+            if not success:
+                return {"success": False, "message": message}
+        return _with_access_database(db_name, operation, _call_deadline("run_vba_functions", timeout_seconds))
+    except Exception as e:
+        return {"success": False, "message": f"Error running VBA functions: {str(e)}"}
+
 @mcp.tool
 def begin_batch_operation(db_name: str) -> str:
     """Start a batch operation - keeps database open for multiple commands.
@@ -1396,6 +4385,7 @@ def begin_batch_operation(db_name: str) -> str:
                 return f"Error: {message}"
         
         _batch_mode_access = win32com.client.Dispatch("Access.Application")
+        _track_access(_batch_mode_access, path, "batch")
         _batch_mode_access.Visible = False
         _batch_mode_access.OpenCurrentDatabase(path)
         _batch_mode_db = db_name
@@ -1403,6 +4393,8 @@ def begin_batch_operation(db_name: str) -> str:
         return f"✓ Batch operation started for '{db_name}'. Database will stay open until you call commit_batch_operation()."
     
     except Exception as e:
+        if _batch_mode_access is not None:
+            _untrack_access(_batch_mode_access)
         _batch_mode_access = None
         _batch_mode_db = None
         return f"Error starting batch operation: {str(e)}"
@@ -1419,6 +4411,7 @@ def commit_batch_operation() -> str:
         return "Error: No batch operation in progress"
     
     db_name = _batch_mode_db
+    _untrack_access(_batch_mode_access)
     
     try:
         # Save all changes
@@ -1463,6 +4456,7 @@ def rollback_batch_operation() -> str:
         return "Error: No batch operation in progress"
     
     db_name = _batch_mode_db
+    _untrack_access(_batch_mode_access)
     
     try:
         # Close without saving
@@ -1489,194 +4483,7 @@ def _generate_report_template_internal(db_name: str, record_source: str, report_
         # Validate record source and get fields
         fields = _get_table_schema(db_name, record_source)
         
-        report_guid = str(uuid.uuid4()).replace('-', '')
-        
-        # Generate controls based on report type
-        if report_type.lower() == "columnar":
-            # Columnar layout - fields stacked vertically
-            controls_text = ""
-            namemap_entries = []
-            y_pos = 500
-            
-            for i, field in enumerate(fields):
-                controls_text += f"""
-                Begin Label
-                    OverlapFlags =85
-                    Left =500
-                    Top ={y_pos}
-                    Width =2000
-                    Height =315
-                    Name ="{field}_Label"
-                    Caption ="{field}:"
-                    GUID = Begin
-                        0x{uuid.uuid4().hex}
-                    End
-                End
-                Begin TextBox
-                    OverlapFlags =85
-                    Left =2700
-                    Top ={y_pos}
-                    Width =4000
-                    Height =315
-                    Name ="{field}"
-                    ControlSource ="{field}"
-                    GUID = Begin
-                        0x{uuid.uuid4().hex}
-                    End
-                End"""
-                
-                # Add to NameMap
-                rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-                field_hex = f"{field}_Label".encode('utf-16le').hex()
-                namemap_entries.append(f"0x{rand_hex}{len(f'{field}_Label'):02x}000000{field_hex}")
-                
-                rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-                field_hex = field.encode('utf-16le').hex()
-                namemap_entries.append(f"0x{rand_hex}{len(field):02x}000000{field_hex}")
-                
-                y_pos += 400
-                
-        else:  # tabular layout (default)
-            # Header controls
-            header_controls = ""
-            detail_controls = ""
-            namemap_entries = []
-            x_pos = 500
-            
-            for i, field in enumerate(fields):
-                # Header label
-                header_controls += f"""
-                Begin Label
-                    OverlapFlags =85
-                    Left ={x_pos}
-                    Top =200
-                    Width =1500
-                    Height =315
-                    Name ="{field}_Header"
-                    Caption ="{field}"
-                    GUID = Begin
-                        0x{uuid.uuid4().hex}
-                    End
-                End"""
-                
-                # Detail textbox
-                detail_controls += f"""
-                Begin TextBox
-                    OverlapFlags =85
-                    Left ={x_pos}
-                    Top =200
-                    Width =1500
-                    Height =315
-                    Name ="{field}"
-                    ControlSource ="{field}"
-                    GUID = Begin
-                        0x{uuid.uuid4().hex}
-                    End
-                End"""
-                
-                # Add to NameMap
-                rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-                field_hex = f"{field}_Header".encode('utf-16le').hex()
-                namemap_entries.append(f"0x{rand_hex}{len(f'{field}_Header'):02x}000000{field_hex}")
-                
-                rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-                field_hex = field.encode('utf-16le').hex()
-                namemap_entries.append(f"0x{rand_hex}{len(field):02x}000000{field_hex}")
-                
-                x_pos += 1600
-            
-            controls_text = f"""
-        Begin Section
-            Height =600
-            Name ="ReportHeader"
-            Begin
-                Begin Label
-                    OverlapFlags =85
-                    Left =500
-                    Top =200
-                    Width =6000
-                    Height =400
-                    Name ="Title"
-                    Caption ="__REPORT_NAME_PLACEHOLDER__"
-                    FontSize =14
-                    FontWeight =700
-                    GUID = Begin
-                        0x{uuid.uuid4().hex}
-                    End
-                End
-            End
-        End
-        Begin Section
-            Height =600
-            Name ="PageHeader"
-            Begin
-                {header_controls}
-            End
-        End
-        Begin Section
-            Height =400
-            Name ="Detail"
-            Begin
-                {detail_controls}
-            End
-        End"""
-        
-        # Add Title to NameMap
-        rand_hex = ''.join(random.choices('0123456789abcdef', k=32))
-        field_hex = "Title".encode('utf-16le').hex()
-        namemap_entries.append(f"0x{rand_hex}05000000{field_hex}")
-        
-        # NameMap
-        namemap_text = ",\n        ".join(namemap_entries) + ",\n        0x000000000000000000000000000000000c000000050000000000000000000000000000000000"
-        
-        if report_type.lower() == "columnar":
-            template = f"""Version =21
-VersionRequired =20
-PublishOption =1
-Checksum ={random.randint(-2000000000, 2000000000)}
-Begin Report
-    Width =7400
-    PictureAlignment =2
-    GUID = Begin
-        0x{report_guid}
-    End
-    NameMap = Begin
-        {namemap_text}
-    End
-    RecordSource ="{record_source}"
-    Caption ="__REPORT_NAME_PLACEHOLDER__"
-    Begin
-        Begin Section
-            Height ={y_pos + 200}
-            Name ="Detail"
-            Begin
-                {controls_text}
-            End
-        End
-    End
-End"""
-        else:  # tabular
-            template = f"""Version =21
-VersionRequired =20
-PublishOption =1
-Checksum ={random.randint(-2000000000, 2000000000)}
-Begin Report
-    Width =7400
-    PictureAlignment =2
-    GUID = Begin
-        0x{report_guid}
-    End
-    NameMap = Begin
-        {namemap_text}
-    End
-    RecordSource ="{record_source}"
-    Caption ="__REPORT_NAME_PLACEHOLDER__"
-    Begin
-        {controls_text}
-    End
-End"""
-        
-        return template
+        return _build_report_layout(record_source, fields, report_type).serialize()
         
     except Exception as e:
         raise Exception(f"Error generating report template: {e}")
@@ -1686,37 +4493,19 @@ def _create_report_from_template_internal(db_name: str, report_name: str, report
     # Replace placeholder if it exists
     if "__REPORT_NAME_PLACEHOLDER__" in report_text:
         report_text = report_text.replace("__REPORT_NAME_PLACEHOLDER__", report_name)
+
+    # Reject malformed definitions before paying for an Access launch
+    errors, warnings = _validate_saveastext(db_name, _parse_saveastext(report_text, report_name), "Report")
+    for warning in warnings:
+        logger.warning(f"Report '{report_name}': {warning}")
+    if errors:
+        raise Exception(f"Report text is invalid (not sent to Access):\n{_format_issue_list(errors)}")
     
     def operation(access):
         """Inner function to create the report"""
         logger.info(f"Creating report: {report_name}")
-        
-        # Write to temp file
-        temp_file_path = None
-        try:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".txt", encoding='utf-8') as tf:
-                tf.write(report_text)
-                temp_file_path = tf.name
-
-            AC_REPORT = 3
-            
-            # Delete existing report if it exists
-            try:
-                access.DoCmd.DeleteObject(AC_REPORT, report_name)
-                logger.debug(f"Deleted existing report: {report_name}")
-            except Exception:
-                logger.debug(f"Report {report_name} doesn't exist (creating new)")
-
-            # Load report from text file
-            access.LoadFromText(AC_REPORT, report_name, temp_file_path)
-            logger.info(f"Report '{report_name}' created successfully")
-
-            return f"Report '{report_name}' created successfully in database '{db_name}'."
-            
-        finally:
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-                logger.debug("Temp file cleaned up")
+        _load_object_from_text(access, AC_REPORT, report_name, report_text)
+        return f"Report '{report_name}' created successfully in database '{db_name}'."
     
     try:
         path = get_db_path(db_name)
@@ -1758,6 +4547,120 @@ def create_report_from_source(db_name: str, report_name: str, record_source: str
     except Exception as e:
         return f"An unexpected error occurred in create_report_from_source: {e}"
 
+@mcp.tool
+def create_reports_batch(db_name: str, reports: list[dict]) -> str:
+    """Create many reports in a single Access session.
+
+    Each entry is {'report_name': ..., 'record_source': ..., 'report_type': 'tabular'|'columnar'}
+    (report_type is optional). Schemas are read over one connection, templates are
+    written to one temp directory by a background thread while Access loads the
+    previous ones, and a failing report does not stop the rest.
+
+    Args:
+        db_name: Database name or path
+        reports: List of report specifications
+
+    Returns:
+        Per-report result lines with timings and a summary
+    """
+    is_valid, error_msg = _validate_database_name(db_name)
+    if not is_valid:
+        return f"Error: {error_msg}"
+    if not reports:
+        return "Error: reports cannot be empty"
+    for spec in reports:
+        if not spec.get("report_name") or not spec.get("record_source"):
+            return f"Error: Each report needs 'report_name' and 'record_source' (got {spec})"
+
+    try:
+        path = get_db_path(db_name)
+        if not os.path.exists(path):
+            return f"Error: Database not found at {path}"
+        schema_errors: Dict[str, str] = {}
+        schemas = _get_table_schemas(db_name, list(dict.fromkeys(spec["record_source"] for spec in reports)),
+                                     schema_errors)
+        if is_database_locked(path):
+            success, message = wait_for_lock_release(path)
+            if not success:
+                return f"Error: {message}"
+    except Exception as e:
+        return f"Error preparing reports: {e}"
+
+    written: List[str] = []
+    try:
+        # Bounded so template generation stays only a few reports ahead of Access
+        pending: "queue.Queue[Optional[Tuple[str, Optional[str], Optional[str]]]]" = queue.Queue(maxsize=4)
+        # Set once the consumer stops taking items, so a blocked producer can exit
+        stop = threading.Event()
+
+        def offer(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=Config.POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            for spec in reports:
+                if stop.is_set():
+                    return
+                report_name = spec["report_name"]
+                try:
+                    if spec["record_source"] in schema_errors:
+                        raise ValueError(schema_errors[spec["record_source"]])
+                    layout = _build_report_layout(spec["record_source"], schemas[spec["record_source"]],
+                                                  spec.get("report_type", "tabular"))
+                    file_path = _scratch.write(layout.serialize().replace("__REPORT_NAME_PLACEHOLDER__", report_name))
+                    written.append(file_path)
+                    item = (report_name, file_path, None)
+                except Exception as e:
+                    item = (report_name, None, str(e))
+                if not offer(item):
+                    return
+            offer(None)
+
+        producer = threading.Thread(target=produce, name="report-templates", daemon=True)
+
+        def operation(access):
+            producer.start()
+            try:
+                return consume(access)
+            finally:
+                stop.set()
+
+        def consume(access):
+            lines = []
+            created = 0
+            while (item := pending.get()) is not None:
+                report_name, file_path, error = item
+                start = time.perf_counter()
+                try:
+                    if error:
+                        raise Exception(f"template generation failed: {error}")
+                    _load_object_from_file(access, AC_REPORT, report_name, file_path)
+                    created += 1
+                    lines.append(f"✓ {report_name} ({time.perf_counter() - start:.2f}s)")
+                except Exception as e:
+                    logger.error(f"Error creating report '{report_name}': {e}")
+                    lines.append(f"✗ {report_name} ({time.perf_counter() - start:.2f}s): {e}")
+            lines.append(f"Created {created} of {len(reports)} reports in database '{db_name}'.")
+            return "\n".join(lines)
+
+        try:
+            return _with_access_database(db_name, operation)
+        except Exception as e:
+            logger.error(f"Error creating reports: {e}")
+            return f"Error creating reports: {str(e)}"
+        finally:
+            # The producer may still be writing; let it notice stop before removing its files
+            stop.set()
+            if producer.is_alive():
+                producer.join()
+    finally:
+        _scratch.remove(written)
+
 @mcp.tool
 def generate_report_template(db_name: str, record_source: str, report_type: str = "tabular") -> str:
     """Generate a text template for an Access report that can be customized and created.
@@ -1797,6 +4700,128 @@ def create_report_from_template(db_name: str, report_name: str, report_text: str
     except Exception as e:
         return f"Error creating report from template: {str(e)}"
             
+# --- Startup ---
+
+_warmup_status: Dict[str, Any] = {"mode": Config.WARMUP or "off", "state": "not started"}
+
+def _warmup_backends(mode: str) -> None:
+    """Preload ODBC/COM backends in the background so the first real call is fast."""
+    time.sleep(Config.WARMUP_DELAY)
+    _warmup_status["state"] = "running"
+    start = time.perf_counter()
+    try:
+        driver = get_driver()
+        logger.info(f"Warm-up: ODBC driver ready ({driver})")
+        if mode == "access":
+            pythoncom.CoInitialize()
+            try:
+                access = win32com.client.Dispatch("Access.Application")
+                _track_access(access, "", "warmup")
+                access.Visible = False
+                access.Quit(2)  # acQuitSaveNone
+                _untrack_access(access)
+                del access
+                logger.info("Warm-up: Access COM server primed")
+            finally:
+                pythoncom.CoUninitialize()
+        _warmup_status["state"] = "done"
+    except Exception as e:
+        logger.warning(f"Warm-up failed (tools will load backends on demand): {e}")
+        _warmup_status["state"] = f"failed: {e}"
+    _warmup_status["seconds"] = round(time.perf_counter() - start, 3)
+
+def _start_warmup() -> None:
+    """Start the background warm-up thread if Config.WARMUP requests one."""
+    mode = Config.WARMUP
+    if mode not in ("drivers", "access"):
+        if mode:
+            logger.warning(f"Unknown warm-up mode '{mode}' (expected 'drivers' or 'access')")
+        return
+    _warmup_status["state"] = "scheduled"
+    threading.Thread(target=_warmup_backends, args=(mode,), name="access-warmup", daemon=True).start()
+
+@mcp.tool
+def get_startup_report() -> str:
+    """Report server startup time, lazy backend import timings and warm-up status."""
+    lines = [f"Module import: {_startup_seconds:.3f}s (budget {Config.STARTUP_BUDGET:.3f}s)"]
+    if _startup_seconds > Config.STARTUP_BUDGET:
+        lines.append("⚠ Startup exceeded budget")
+    lines.append("Lazy imports:")
+    for name in ("pyodbc", "win32com.client", "pythoncom"):
+        if name in _import_timings:
+            lines.append(f"- {name}: {_import_timings[name]:.3f}s")
+        else:
+            lines.append(f"- {name}: not loaded yet")
+    lines.append(f"ODBC driver: {_driver_name or 'not resolved yet'}")
+    warmup = f"Warm-up: {_warmup_status['mode']} ({_warmup_status['state']})"
+    if "seconds" in _warmup_status:
+        warmup += f" in {_warmup_status['seconds']:.3f}s"
+    lines.append(warmup)
+    return "\n".join(lines)
+
+@mcp.tool
+def get_server_metrics() -> str:
+    """Report retry counts for transient errors and pooled ODBC connection usage."""
+    with _metrics_lock:
+        retries = dict(_retry_metrics["retries"])
+        lines = [
+            "Retries:",
+            f"- Calls retried: {_retry_metrics['retried_calls']}",
+            f"- Recovered after retry: {_retry_metrics['recovered']}",
+            f"- Gave up after retries: {_retry_metrics['exhausted']}",
+        ]
+    for category, count in sorted(retries.items()):
+        lines.append(f"- {category}: {count} retries")
+    with _watchdog_lock:
+        totals = dict(_watchdog_totals)
+        tracked = len(_access_instances)
+    lines.append("Access watchdog:")
+    lines.append(f"- Tracked instances: {tracked}")
+    lines.append(f"- Sweeps: {totals['sweeps']}, processes terminated: {totals['terminated']}, "
+                 f"memory reclaimed: {totals['memory_reclaimed_bytes'] // 1024} KB, lock files removed: {totals['locks_removed']}")
+    lines.append("Pooled ODBC connections:")
+    with _pool_lock:
+        if not _connection_pool:
+            lines.append("- none open")
+        for (path, read_only), pooled in _connection_pool.items():
+            profile = "read-only" if read_only else "read-write"
+            lines.append(f"- {path} ({profile}): {pooled.hits} statement cache hits, {pooled.misses} misses")
+    return "\n".join(lines)
+
+@mcp.tool
+def reap_access_instances() -> dict:
+    """
+    Sweep the Access processes this server launched and reclaim stuck ones now.
+
+    Instances that were closed but never exited, and in-use instances that have
+    stopped responding, are terminated; lock files they left are removed. The
+    same sweep runs in the background every Config.WATCHDOG_INTERVAL seconds.
+    
+    Returns:
+        dict with this sweep's checked/exited/terminated/locks_removed and the
+        memory reclaimed, plus running totals
+    """
+    try:
+        report = _sweep_access_instances()
+    except Exception as e:
+        logger.error(f"Error sweeping Access instances: {e}")
+        return {"success": False, "message": f"Error sweeping Access instances: {str(e)}"}
+    with _watchdog_lock:
+        report["totals"] = dict(_watchdog_totals)
+        report["tracked"] = [{"pid": i.pid, "owner": i.owner, "database": i.db_path,
+                              "in_use": i.released is None, "age_seconds": round(time.time() - i.started)}
+                             for i in _access_instances.values()]
+    report["success"] = True
+    return report
+
+_startup_seconds = time.perf_counter() - _SERVER_START
+
 if __name__ == "__main__":
+    if _startup_seconds > Config.STARTUP_BUDGET:
+        logger.warning(f"Startup took {_startup_seconds:.3f}s (budget {Config.STARTUP_BUDGET:.3f}s)")
+    else:
+        logger.info(f"Startup took {_startup_seconds:.3f}s")
+    _start_warmup()
+    _start_watchdog()
     mcp.run()
 